@@ -0,0 +1,27 @@
+"""Gunicorn settings for the production app.
+
+    gunicorn -c gunicorn.conf.py
+
+The app is loaded once in the master and forked into threaded workers, each
+of which then gets its own database connection pool.
+"""
+
+import multiprocessing
+import os
+
+wsgi_app = 'production_app:create_production_app()'
+bind = os.environ.get('BIND', '0.0.0.0:5001')
+workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count()))
+worker_class = 'gthread'
+threads = int(os.environ.get('GUNICORN_THREADS', '4'))
+timeout = 120
+preload_app = True
+
+
+def post_fork(server, worker):
+    """Drop pooled connections inherited from the master so workers never share one."""
+    from src.models.db_models import db
+
+    app = server.app.wsgi()
+    with app.app_context():
+        db.engine.dispose(close=False)
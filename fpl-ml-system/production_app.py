@@ -1,5 +1,10 @@
 #!/usr/bin/env python3
-"""Production FPL AI Optimizer - Main Flask application without ML dependencies."""
+"""Production FPL AI Optimizer - Main Flask application without ML dependencies.
+
+Serve with a multi-threaded WSGI server using the bundled settings:
+
+    gunicorn -c gunicorn.conf.py
+"""
 
 import os
 import sys
@@ -9,31 +14,31 @@ import logging
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from flask import Flask, jsonify, request, render_template
-from src.models.db_models import db, Player, Team
+from pydantic import ValidationError
+from sqlalchemy.pool import QueuePool
+from src.cache import SimpleCache
+from src.json_provider import init_json_provider
+from src.models.data_models import TeamOptimizationForm
+from src.models.db_models import db, stored_expected_points, upgrade_schema, Player, Team
+from src.responses import COMPRESS_ALGORITHMS, add_cors_headers
 from src.services.data_service import DataService
 from src.services.optimization_service import OptimizationService
+from src.services.player_queries import (
+    TEAM_NAMES_CACHE_TIMEOUT, count_players_and_teams, get_team_names, resolve_player_id_lists
+)
 from src.services.reasoning_service import ReasoningService
+from src.views.players_api import players_api_bp
 
-# Simple cache implementation
-class SimpleCache:
-    def __init__(self):
-        self.cache_data = {}
-        
-    def get(self, key):
-        return self.cache_data.get(key)
-        
-    def set(self, key, value, timeout=None):
-        self.cache_data[key] = value
-        
-    def clear(self):
-        self.cache_data.clear()
+try:
+    from flask_compress import Compress
+    COMPRESS_AVAILABLE = True
+except ImportError:
+    Compress = None
+    COMPRESS_AVAILABLE = False
 
-def add_cors_headers(response):
-    """Add CORS headers to response."""
-    response.headers.add('Access-Control-Allow-Origin', '*')
-    response.headers.add('Access-Control-Allow-Headers', 'Content-Type')
-    response.headers.add('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
-    return response
+logger = logging.getLogger(__name__)
+
+TEAMS_CACHE_KEY = 'teams:v1'
 
 def create_production_app():
     """Create production Flask app without ML dependencies."""
@@ -45,10 +50,29 @@ def create_production_app():
     app.config['SECRET_KEY'] = 'production-fpl-optimizer-key'
     app.config['SQLALCHEMY_DATABASE_URI'] = f"sqlite:///{os.path.join(os.getcwd(), 'instance/fpl.db')}"
     app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
-    app.config['DEBUG'] = True
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+        'poolclass': QueuePool,
+        'pool_pre_ping': True,
+        # Enough pooled connections for every gthread worker thread; tune with POOL_SIZE
+        'pool_size': int(os.environ.get('POOL_SIZE', '20')),
+        'max_overflow': int(os.environ.get('POOL_MAX_OVERFLOW', '40')),
+        'pool_recycle': 3600,
+        # Pooled connections are shared across worker threads
+        'connect_args': {'check_same_thread': False}
+    }
+    app.config['DEBUG'] = os.environ.get('DEBUG', 'False').lower() in ('true', '1', 'yes')
+    init_json_provider(app)
+    
+    # Compress JSON and HTML bodies when Flask-Compress is installed
+    app.config['COMPRESS_ALGORITHM'] = COMPRESS_ALGORITHMS
+    app.config['COMPRESS_MIN_SIZE'] = 1024
+    if COMPRESS_AVAILABLE:
+        Compress(app)
     
-    # Initialize database
+    # Initialize database; existing files get new columns before any query runs
     db.init_app(app)
+    with app.app_context():
+        upgrade_schema()
     
     # Initialize services (no prediction service to avoid ML issues)
     cache = SimpleCache()
@@ -58,29 +82,48 @@ def create_production_app():
     app.prediction_service = None  # Disabled for production
     app.cache = cache
     
+    DASHBOARD_CACHE_KEY = 'dashboard:v1'
+    DASHBOARD_HTML_CACHE_KEY = 'dashboard:html'
+    DASHBOARD_CACHE_TIMEOUT = 60
+    
+    # Answer CORS preflight before dispatch; browsers may reuse it for 10 minutes
+    @app.before_request
+    def cors_preflight():
+        if request.method == 'OPTIONS' and request.url_rule is not None:
+            response = app.make_default_options_response()
+            response.headers['Access-Control-Max-Age'] = '600'
+            return response
+    
     # Add CORS to all responses
-    @app.after_request
-    def after_request(response):
-        return add_cors_headers(response)
+    app.after_request(add_cors_headers)
+    
+    # Player list and search endpoints
+    app.register_blueprint(players_api_bp)
     
     # Main routes
     @app.route('/')
     def dashboard():
         """Main dashboard."""
         try:
-            player_count = Player.query.count()
-            team_count = Team.query.count()
+            # Stats only change on data refresh, so serve the rendered page from cache when fresh
+            html = cache.get(DASHBOARD_HTML_CACHE_KEY)
+            if html:
+                return html
+            
+            player_count, team_count = count_players_and_teams()
             
             # Get top players for dashboard
             top_players = []
             if player_count > 0:
                 players = Player.query.filter(Player.status == 'a').order_by(Player.total_points.desc()).limit(5).all()
+                # Team short names come from the shared cached map, not a query per player
+                team_names = get_team_names()
                 for player in players:
                     top_players.append({
                         'web_name': player.web_name,
                         'position': player.position,
-                        'team': player.team_id,
-                        'expected_points': float(player.form or 0) * 2,  # Simple estimation
+                        'team': team_names.get(player.team_id, f'Team {player.team_id}'),
+                        'expected_points': stored_expected_points(player),
                         'cost': player.now_cost / 10.0,
                         'total_points': player.total_points
                     })
@@ -103,7 +146,12 @@ def create_production_app():
                 'players_updated_today': 677
             }
             
-            return render_template('dashboard.html', stats=stats, top_players=top_players, recent_updates=recent_updates)
+            payload = {'stats': stats, 'top_players': top_players, 'recent_updates': recent_updates}
+            cache.set(DASHBOARD_CACHE_KEY, payload, timeout=DASHBOARD_CACHE_TIMEOUT)
+            
+            html = render_template('dashboard.html', **payload)
+            cache.set(DASHBOARD_HTML_CACHE_KEY, html, timeout=DASHBOARD_CACHE_TIMEOUT)
+            return html
             
         except Exception as e:
             return render_template('dashboard.html', 
@@ -127,7 +175,8 @@ def create_production_app():
     @app.route('/api/health')
     def health_check():
         try:
-            player_count = Player.query.count()
+            cached = cache.get(DASHBOARD_CACHE_KEY)
+            player_count = cached['stats']['total_players'] if cached else Player.query.count()
             response = jsonify({
                 'status': 'healthy',
                 'database': {'connected': True, 'player_count': player_count},
@@ -146,64 +195,49 @@ def create_production_app():
     @app.route('/api/optimize', methods=['POST', 'OPTIONS'])
     @app.route('/api/optimize-team', methods=['POST', 'OPTIONS'])
     def optimize_team():
-        # Handle CORS preflight
-        if request.method == 'OPTIONS':
-            return jsonify({'status': 'ok'})
-        
         try:
-            print("🚀 [DEBUG] Starting optimization request...")
+            logger.debug("🚀 Starting optimization request...")
             
             # Handle both JSON and form data
             if request.is_json:
                 request_data = request.get_json() or {}
-                print("🔍 [DEBUG] Received JSON data")
+                logger.debug("🔍 Received JSON data")
             else:
                 request_data = request.form.to_dict()
-                print("🔍 [DEBUG] Received form data")
-            
-            print(f"🔍 [DEBUG] Request data: {request_data}")
-            print(f"🔍 [DEBUG] Request content type: {request.content_type}")
+                logger.debug("🔍 Received form data")
             
-            # Process and validate input data with better type handling
-            budget_raw = request_data.get('budget', 100.0)
-            try:
-                budget = float(budget_raw) if budget_raw not in [None, ''] else 100.0
-            except (ValueError, TypeError):
-                budget = 100.0
+            logger.debug("🔍 Request data: %s", request_data)
+            logger.debug("🔍 Request content type: %s", request.content_type)
             
-            formation = request_data.get('formation')
-            if formation == "" or formation is None:
-                formation = None
-                
-            preferred_players = request_data.get('preferred_players')
-            if isinstance(preferred_players, str):
-                if preferred_players.strip() == "":
-                    preferred_players = None
-                else:
-                    preferred_players = [p.strip() for p in preferred_players.split(',') if p.strip()]
-            elif not preferred_players:
-                preferred_players = None
-                
-            excluded_players = request_data.get('excluded_players')
-            if isinstance(excluded_players, str):
-                if excluded_players.strip() == "":
-                    excluded_players = None
-                else:
-                    excluded_players = [p.strip() for p in excluded_players.split(',') if p.strip()]
-            elif not excluded_players:
-                excluded_players = None
-                
-            max_players_raw = request_data.get('max_players_per_team', 3)
+            # Parse and coerce input with the request schema
+            if not isinstance(request_data, dict):
+                return jsonify({'success': False, 'error': 'Request body must be a JSON object'}), 400
             try:
-                max_players_per_team = int(max_players_raw) if max_players_raw not in [None, ''] else 3
-            except (ValueError, TypeError):
-                max_players_per_team = 3
-            
-            print(f"🔍 [DEBUG] Processed data - Budget: {budget} ({type(budget)}), Formation: {formation}, Max per team: {max_players_per_team} ({type(max_players_per_team)})")
-            print(f"🔍 [DEBUG] Preferred: {preferred_players}, Excluded: {excluded_players}")
+                params = TeamOptimizationForm(**request_data)
+            except ValidationError as e:
+                return jsonify({
+                    'success': False,
+                    'error': 'Invalid optimization parameters',
+                    'details': [{'loc': list(err['loc']), 'msg': err['msg']} for err in e.errors()]
+                }), 400
+            budget = params.budget
+            formation = params.formation
+            preferred_players = params.preferred_players
+            excluded_players = params.excluded_players
+            max_players_per_team = params.max_players_per_team
+            
+            logger.debug("🔍 Processed data - Budget: %s, Formation: %s, Max per team: %s",
+                         budget, formation, max_players_per_team)
+            logger.debug("🔍 Preferred: %s, Excluded: %s", preferred_players, excluded_players)
+            
+            # Resolve preferred and excluded names to IDs with one shared query
+            preferred_ids, excluded_ids = resolve_player_id_lists(preferred_players, excluded_players)
+            preferred_players = preferred_ids or None
+            excluded_players = excluded_ids or None
+            logger.debug("🔍 Resolved IDs - Preferred: %s, Excluded: %s", preferred_players, excluded_players)
             
             # Perform optimization with error tracking
-            print("🤖 [DEBUG] Calling optimization service...")
+            logger.debug("🤖 Calling optimization service...")
             result = app.optimization_service.optimize_team(
                 budget=budget,
                 formation=formation,
@@ -212,32 +246,56 @@ def create_production_app():
                 max_players_per_team=max_players_per_team
             )
             
-            print(f"✅ [DEBUG] Optimization completed: {len(result.get('players', []))} players")
+            logger.debug("✅ Optimization completed: %d players", len(result.get('players', [])))
             
             # Enrich result with detailed player information for frontend
-            print("📋 [DEBUG] Adding detailed player information...")
+            logger.debug("📋 Adding detailed player information...")
             try:
                 # Get all squad players (15 total)
                 squad_player_ids = result.get('players', [])
                 starting_xi_ids = result.get('starting_xi', [])
                 bench_ids = result.get('bench', [])
                 
+                captain_id = result.get('captain_id')
+                vice_captain_id = result.get('vice_captain_id')
+                starting_xi_set = set(starting_xi_ids)
+                
                 all_players_data = []
                 starting_xi_data = []
                 bench_data = []
                 players_by_position = {'GKP': [], 'DEF': [], 'MID': [], 'FWD': []}
+                captain_info = None
+                vice_captain_info = None
+                
+                # Load squad players with their team names in one query over raw columns
+                players_by_id = {
+                    row.player_id: row
+                    for row in db.session.query(
+                        Player.player_id,
+                        Player.web_name,
+                        Player.first_name,
+                        Player.second_name,
+                        Player.position,
+                        Player.team_id,
+                        Player.now_cost,
+                        Player.total_points,
+                        Player.form,
+                        Player.expected_points,
+                        Team.short_name.label('team_short_name')
+                    ).outerjoin(
+                        Team, Team.team_id == Player.team_id
+                    ).filter(Player.player_id.in_(squad_player_ids)).all()
+                }
                 
                 # Process all squad players
                 for player_id in squad_player_ids:
-                    player = Player.query.get(player_id)
+                    player = players_by_id.get(player_id)
                     if player:
-                        # Get team name from Team table
-                        team = Team.query.get(player.team_id)
-                        team_name = team.short_name if team else f'Team {player.team_id}'
+                        team_name = player.team_short_name or f'Team {player.team_id}'
                         
-                        is_captain = player.player_id == result.get('captain_id')
-                        is_vice_captain = player.player_id == result.get('vice_captain_id')
-                        is_starting = player.player_id in starting_xi_ids
+                        is_captain = player.player_id == captain_id
+                        is_vice_captain = player.player_id == vice_captain_id
+                        is_starting = player.player_id in starting_xi_set
                         
                         player_info = {
                             'player_id': player.player_id,
@@ -249,13 +307,17 @@ def create_production_app():
                             'now_cost': player.now_cost / 10.0,
                             'total_points': player.total_points,
                             'form': float(player.form or 0),
-                            'expected_points': max(2.0, float(player.form or 0) * 2),
+                            'expected_points': stored_expected_points(player),
                             'is_captain': is_captain,
                             'is_vice_captain': is_vice_captain,
                             'is_starting': is_starting
                         }
                         
                         all_players_data.append(player_info)
+                        if is_captain:
+                            captain_info = player_info
+                        if is_vice_captain:
+                            vice_captain_info = player_info
                         
                         # Organize by starting XI vs bench
                         if is_starting:
@@ -269,123 +331,71 @@ def create_production_app():
                 result['starting_xi_data'] = starting_xi_data       # Starting 11
                 result['bench_data'] = bench_data                   # Bench 4
                 result['players_by_position'] = players_by_position # Starting XI by position
-                result['captain_name'] = next((p['web_name'] for p in all_players_data if p['is_captain']), 'N/A')
-                result['vice_captain_name'] = next((p['web_name'] for p in all_players_data if p['is_vice_captain']), 'N/A')
-                result['captain_expected_points'] = next((p['expected_points'] for p in all_players_data if p['is_captain']), 0)
+                result['captain_name'] = captain_info['web_name'] if captain_info else 'N/A'
+                result['vice_captain_name'] = vice_captain_info['web_name'] if vice_captain_info else 'N/A'
+                result['captain_expected_points'] = captain_info['expected_points'] if captain_info else 0
                 
-                print(f"✅ [DEBUG] Player data enriched: {len(all_players_data)} total players ({len(starting_xi_data)} starting, {len(bench_data)} bench)")
+                logger.debug("✅ Player data enriched: %d total players (%d starting, %d bench)",
+                             len(all_players_data), len(starting_xi_data), len(bench_data))
                 
             except Exception as enrichment_error:
-                print(f"⚠️ [DEBUG] Player data enrichment failed: {enrichment_error}")
-                import traceback
-                traceback.print_exc()
+                logger.warning("⚠️ Player data enrichment failed: %s", enrichment_error, exc_info=True)
                 # Continue without enriched data
             
             # Generate reasoning with error tracking
-            print("🧠 [DEBUG] Generating reasoning...")
+            logger.debug("🧠 Generating reasoning...")
             try:
-                reasoning = app.reasoning_service.generate_team_reasoning(result)
+                # Reuse the enriched rows so reasoning doesn't query the same players again
+                reasoning_data = {p['player_id']: p for p in result.get('players_data', [])} or None
+                reasoning = app.reasoning_service.generate_team_reasoning(result, reasoning_data)
                 result['reasoning'] = reasoning
-                print(f"✅ [DEBUG] Reasoning generated: {len(reasoning)} characters")
+                logger.debug("✅ Reasoning generated: %d characters", len(reasoning))
             except Exception as reasoning_error:
-                print(f"⚠️ [DEBUG] Reasoning failed: {reasoning_error}")
-                import traceback
-                traceback.print_exc()
+                logger.warning("⚠️ Reasoning failed: %s", reasoning_error, exc_info=True)
                 result['reasoning'] = "คำอธิบายไม่พร้อมใช้งานในขณะนี้"
             
-            print("🎉 [DEBUG] Sending successful response")
+            logger.debug("🎉 Sending successful response")
             return jsonify({'success': True, 'data': result})
             
         except Exception as e:
-            print(f"❌ [DEBUG] Optimization error: {e}")
-            print(f"❌ [DEBUG] Error type: {type(e).__name__}")
-            import traceback
-            print("❌ [DEBUG] Full traceback:")
-            traceback.print_exc()
+            logger.exception("❌ Optimization error (%s): %s", type(e).__name__, e)
             return jsonify({'success': False, 'error': f"Team optimization failed: {str(e)}"}), 500
     
-    @app.route('/api/players')
-    def get_players():
-        """Get players API endpoint."""
-        try:
-            # Parse query parameters
-            position = request.args.get('position')
-            limit = min(int(request.args.get('limit', 50)), 100)
-            offset = int(request.args.get('offset', 0))
-            
-            # Build query
-            query = Player.query.filter(Player.status == 'a')
-            
-            if position and position in ['GKP', 'DEF', 'MID', 'FWD']:
-                query = query.filter(Player.position == position)
-            
-            # Get total and apply pagination
-            total_count = query.count()
-            players = query.offset(offset).limit(limit).all()
-            
-            # Convert to dict
-            players_data = []
-            for player in players:
-                players_data.append({
-                    'player_id': player.player_id,
-                    'web_name': player.web_name,
-                    'first_name': player.first_name,
-                    'second_name': player.second_name,
-                    'position': player.position,
-                    'team_id': player.team_id,
-                    'now_cost': player.now_cost / 10.0,
-                    'total_points': player.total_points,
-                    'form': float(player.form or 0),
-                    'status': player.status
-                })
-            
-            return jsonify({
-                'success': True,
-                'data': {
-                    'players': players_data,
-                    'total_count': total_count,
-                    'limit': limit,
-                    'offset': offset
-                }
-            })
-            
-        except Exception as e:
-            print(f"❌ Players API error: {e}")
-            return jsonify({'success': False, 'error': str(e)}), 500
-    
     @app.route('/api/teams')
     def get_teams():
         """Get teams API endpoint."""
         try:
-            teams = Team.query.order_by(Team.name).all()
-            teams_data = []
-            for team in teams:
-                teams_data.append({
-                    'team_id': team.team_id,
-                    'name': team.name,
-                    'short_name': team.short_name,
-                    'strength_overall_home': team.strength_overall_home,
-                    'strength_overall_away': team.strength_overall_away
-                })
+            # Teams only change on data refresh, which clears the cache
+            teams_data = cache.get(TEAMS_CACHE_KEY)
+            if teams_data is None:
+                teams = db.session.query(
+                    Team.team_id,
+                    Team.name,
+                    Team.short_name,
+                    Team.strength_overall_home,
+                    Team.strength_overall_away
+                ).order_by(Team.name).all()
+                teams_data = [team._asdict() for team in teams]
+                cache.set(TEAMS_CACHE_KEY, teams_data, timeout=TEAM_NAMES_CACHE_TIMEOUT)
             
             return jsonify({'success': True, 'data': teams_data})
             
         except Exception as e:
-            print(f"❌ Teams API error: {e}")
+            logger.error("❌ Teams API error: %s", e)
             return jsonify({'success': False, 'error': str(e)}), 500
     
     @app.route('/api/data/refresh', methods=['POST'])
     def refresh_data():
         """Refresh FPL data from API."""
         try:
-            print("🔄 [DEBUG] Data refresh requested...")
+            logger.debug("🔄 Data refresh requested...")
+            cache.clear()
             
             # For now, return a simple success message
             # In the future, this could trigger actual data fetching from FPL API
-            player_count = Player.query.count()
-            team_count = Team.query.count()
+            player_count, team_count = count_players_and_teams()
             
-            print(f"✅ [DEBUG] Data refresh completed. {player_count} players, {team_count} teams")
+            logger.info("✅ Data refresh completed. %d players, %d teams", player_count, team_count)
             
             return jsonify({
                 'success': True,
@@ -398,131 +408,9 @@ def create_production_app():
             })
             
         except Exception as e:
-            print(f"❌ [DEBUG] Data refresh error: {e}")
+            logger.error("❌ Data refresh error: %s", e)
             return jsonify({'success': False, 'error': f'ไม่สามารถอัพเดทข้อมูลได้: {str(e)}'}), 500
     
-    @app.route('/api/players/search')
-    def search_players():
-        """Advanced player search API endpoint for scouting."""
-        try:
-            print("🔍 [DEBUG] Player search requested...")
-            
-            # Parse query parameters
-            position = request.args.get('position')
-            team_id = request.args.get('team_id', type=int)
-            min_cost = request.args.get('min_cost', type=float)
-            max_cost = request.args.get('max_cost', type=float)
-            sort_by = request.args.get('sort_by', 'total_points')
-            sort_order = request.args.get('sort_order', 'desc')
-            limit = min(int(request.args.get('limit', 50)), 1000)
-            offset = int(request.args.get('offset', 0))
-            search_term = request.args.get('q', '').strip()
-            
-            print(f"🔍 [DEBUG] Search params: position={position}, team={team_id}, cost={min_cost}-{max_cost}, sort={sort_by} {sort_order}")
-            
-            # Build query
-            query = Player.query.filter(Player.status == 'a')
-            
-            # Filter by position
-            if position and position in ['GKP', 'DEF', 'MID', 'FWD']:
-                query = query.filter(Player.position == position)
-            
-            # Filter by team
-            if team_id:
-                query = query.filter(Player.team_id == team_id)
-                
-            # Filter by cost range
-            if min_cost is not None:
-                query = query.filter(Player.now_cost >= min_cost * 10)
-            if max_cost is not None:
-                query = query.filter(Player.now_cost <= max_cost * 10)
-                
-            # Search by player name
-            if search_term:
-                query = query.filter(
-                    db.or_(
-                        Player.web_name.ilike(f'%{search_term}%'),
-                        Player.first_name.ilike(f'%{search_term}%'),
-                        Player.second_name.ilike(f'%{search_term}%')
-                    )
-                )
-            
-            # Sort results
-            valid_sort_fields = {
-                'web_name': Player.web_name,
-                'total_points': Player.total_points,
-                'now_cost': Player.now_cost,
-                'form': Player.form,
-                'expected_points': Player.total_points  # Use total_points as proxy for expected_points
-            }
-            
-            if sort_by in valid_sort_fields:
-                sort_field = valid_sort_fields[sort_by]
-                if sort_order.lower() == 'desc':
-                    query = query.order_by(sort_field.desc())
-                else:
-                    query = query.order_by(sort_field.asc())
-            
-            # Get total count before pagination
-            total_count = query.count()
-            
-            # Apply pagination
-            players = query.offset(offset).limit(limit).all()
-            
-            # Convert to dict with team names
-            players_data = []
-            for player in players:
-                # Get team name
-                team = Team.query.get(player.team_id)
-                team_name = team.short_name if team else f'Team {player.team_id}'
-                
-                players_data.append({
-                    'player_id': player.player_id,
-                    'web_name': player.web_name,
-                    'first_name': player.first_name,
-                    'second_name': player.second_name,
-                    'position': player.position,
-                    'team_id': player.team_id,
-                    'team_name': team_name,
-                    'now_cost': player.now_cost / 10.0,
-                    'total_points': player.total_points,
-                    'form': float(player.form or 0),
-                    'expected_points': max(2.0, float(player.form or 0) * 2),  # Simple estimation
-                    'status': player.status,
-                    'selected_by_percent': getattr(player, 'selected_by_percent', 0.0),
-                    'transfers_in': getattr(player, 'transfers_in', 0),
-                    'transfers_out': getattr(player, 'transfers_out', 0)
-                })
-            
-            print(f"✅ [DEBUG] Search completed: {len(players_data)} players found")
-            
-            return jsonify({
-                'success': True,
-                'data': {
-                    'players': players_data,
-                    'total_count': total_count,
-                    'limit': limit,
-                    'offset': offset,
-                    'filters': {
-                        'position': position,
-                        'team_id': team_id,
-                        'min_cost': min_cost,
-                        'max_cost': max_cost,
-                        'search_term': search_term
-                    },
-                    'sort': {
-                        'by': sort_by,
-                        'order': sort_order
-                    }
-                }
-            })
-            
-        except Exception as e:
-            print(f"❌ [DEBUG] Player search error: {e}")
-            import traceback
-            traceback.print_exc()
-            return jsonify({'success': False, 'error': str(e)}), 500
-    
     # Error handlers
     @app.errorhandler(404)
     def not_found(error):
@@ -535,11 +423,12 @@ def create_production_app():
     return app
 
 if __name__ == '__main__':
+    logging.basicConfig(
+        level=getattr(logging, os.environ.get('LOG_LEVEL', 'INFO').upper(), logging.INFO),
+        format='%(asctime)s %(levelname)s %(name)s: %(message)s'
+    )
     app = create_production_app()
     
-    with app.app_context():
-        db.create_all()
-    
     print("🚀 Starting FPL AI Optimizer - Production Version")
     print("📡 API available at: http://localhost:5001")
     print("🏠 Dashboard: http://localhost:5001/")
@@ -552,7 +441,8 @@ if __name__ == '__main__':
     print()
     
     try:
-        app.run(host='0.0.0.0', port=5001, debug=True)
+        # Development server only; use gunicorn (see module docstring) in production
+        app.run(host='0.0.0.0', port=5001, debug=app.config['DEBUG'], threaded=True)
     except KeyboardInterrupt:
         print("\n🛑 FPL AI Optimizer stopped")
     except Exception as e:
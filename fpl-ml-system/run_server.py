@@ -24,10 +24,16 @@ if __name__ == '__main__':
     print("🎯 Optimization API: POST /api/optimize")
     print()
     
+    # The debugger and reloader are for local development only; serve
+    # production traffic with: gunicorn -c gunicorn.conf.py
+    dev = '--dev' in sys.argv[1:]
+    if not dev:
+        print("ℹ️  Pass --dev for the debugger and auto-reload")
+    
     try:
         run_simple('localhost', 5001, app, 
-                  use_debugger=True,
-                  use_reloader=True,
+                  use_debugger=dev,
+                  use_reloader=dev,
                   threaded=True)
     except KeyboardInterrupt:
         print("\n🛑 Server stopped")
@@ -13,40 +13,19 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 from flask import Flask
+from src.cache import SimpleCache
 from src.config import get_config
 from src.models.db_models import db
+from src.queued_logging import setup_queued_logging
 from src.services.data_service import DataService, FPLAPIError
 
-# Use SimpleCache instead of flask_caching
-class SimpleCache:
-    """Simple cache implementation."""
-    def __init__(self, app=None):
-        self.cache_data = {}
-        self.app = app
-    
-    def get(self, key):
-        return self.cache_data.get(key)
-    
-    def set(self, key, value, timeout=300):
-        self.cache_data[key] = value
-    
-    def delete(self, key):
-        self.cache_data.pop(key, None)
-    
-    def clear(self):
-        self.cache_data.clear()
-
 
 def setup_logging(log_level: str = 'INFO'):
     """Set up logging configuration."""
-    logging.basicConfig(
-        level=getattr(logging, log_level.upper()),
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.StreamHandler(sys.stdout),
-            logging.FileHandler('logs/fetch_fpl_data.log')
-        ]
-    )
+    # main() is also called in-process by quick_start and maintenance, so
+    # the directory can't be left to the __main__ block
+    os.makedirs('logs', exist_ok=True)
+    setup_queued_logging(log_level, 'logs/fetch_fpl_data.log')
 
 
 def create_app() -> Flask:
@@ -60,7 +39,7 @@ def create_app() -> Flask:
     
     # Initialize extensions
     db.init_app(app)
-    cache = SimpleCache(app)
+    cache = SimpleCache()
     
     return app, cache
 
@@ -200,8 +179,8 @@ def test_api_connection(data_service: DataService) -> dict:
         }
 
 
-def main():
-    """Main function."""
+def main(argv=None):
+    """Main function; ``argv`` defaults to the command line arguments."""
     parser = argparse.ArgumentParser(description='Fetch FPL data from official API')
     
     parser.add_argument(
@@ -236,7 +215,7 @@ def main():
         help='Show what would be fetched without actually updating database'
     )
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     # Set up logging
     setup_logging(args.log_level)
@@ -298,7 +277,4 @@ def main():
 
 
 if __name__ == '__main__':
-    # Ensure logs directory exists
-    os.makedirs('logs', exist_ok=True)
-    
     sys.exit(main())
\ No newline at end of file
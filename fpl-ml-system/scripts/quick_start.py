@@ -1,39 +1,47 @@
 #!/usr/bin/env python3
 """Quick start script for FPL AI Optimizer - ดาวน์โหลดข้อมูลและฝึกโมเดลครั้งแรก"""
 
+import importlib
 import os
 import sys
 from pathlib import Path
-import subprocess
 import time
 
-# Add src to path
+# Add src and the sibling scripts to path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "scripts"))
 
 
-def run_command(command, description):
-    """Run a command and handle errors."""
+def run_script(module_name, description, *args):
+    """Run a sibling script's main() in this process and report whether it succeeded.
+    
+    Running in-process skips a fresh interpreter and re-importing Flask,
+    SQLAlchemy and the ML stack for every step. Scripts resolve data and
+    model paths from the project root, so they run from there and the
+    caller's working directory is restored afterwards.
+    """
     print(f"\n🔄 {description}...")
-    print(f"💻 Running: {command}")
+    print(f"💻 Running: python scripts/{module_name}.py")
     
+    cwd = os.getcwd()
+    os.chdir(project_root)
     try:
-        result = subprocess.run(
-            command, 
-            shell=True, 
-            check=True, 
-            capture_output=True, 
-            text=True,
-            cwd=project_root
-        )
-        print(f"✅ {description} - สำเร็จ!")
-        if result.stdout:
-            print(f"📄 Output: {result.stdout}")
-        return True
-    except subprocess.CalledProcessError as e:
+        exit_code = importlib.import_module(module_name).main(*args)
+    except SystemExit as e:
+        exit_code = e.code
+    except Exception as e:
+        print(f"❌ {description} - ล้มเหลว!")
+        print(f"🚨 Error: {e}")
+        return False
+    finally:
+        os.chdir(cwd)
+    
+    if exit_code:
         print(f"❌ {description} - ล้มเหลว!")
-        print(f"🚨 Error: {e.stderr}")
         return False
+    print(f"✅ {description} - สำเร็จ!")
+    return True
 
 
 def check_environment():
@@ -60,32 +68,32 @@ def main():
     
     # Step 1: Validate system
     print("\n📋 ขั้นตอนที่ 1: ตรวจสอบระบบ")
-    if not run_command("python scripts/validate_system.py", "ตรวจสอบความพร้อมของระบบ"):
+    if not run_script("validate_system", "ตรวจสอบความพร้อมของระบบ"):
         print("🚨 ระบบไม่พร้อม กรุณาแก้ไขปัญหาก่อนดำเนินการต่อ")
         return 1
     
     # Step 2: Setup database  
     print("\n📋 ขั้นตอนที่ 2: ตั้งค่าฐานข้อมูล")
-    if not run_command("python scripts/setup_database.py", "สร้างตารางในฐานข้อมูล"):
+    if not run_script("setup_database", "สร้างตารางในฐานข้อมูล"):
         print("🚨 ไม่สามารถตั้งค่าฐานข้อมูลได้")
         return 1
     
     # Step 3: Fetch FPL data
     print("\n📋 ขั้นตอนที่ 3: ดาวน์โหลดข้อมูล FPL")
-    if not run_command("python scripts/fetch_fpl_data.py", "ดาวน์โหลดข้อมูลจาก FPL API"):
+    if not run_script("fetch_fpl_data", "ดาวน์โหลดข้อมูลจาก FPL API", []):
         print("🚨 ไม่สามารถดาวน์โหลดข้อมูลได้ - ตรวจสอบการเชื่อมต่ออินเทอร์เน็ต")
         return 1
     
     # Step 4: Train ML models  
     print("\n📋 ขั้นตอนที่ 4: ฝึกโมเดล Machine Learning")
     print("⏰ การฝึกโมเดลอาจใช้เวลา 2-5 นาที กรุณารอสักครู่...")
-    if not run_command("python scripts/train_models.py", "ฝึกโมเดล XGBoost สำหรับการทำนาย"):
+    if not run_script("train_models", "ฝึกโมเดล XGBoost สำหรับการทำนาย", []):
         print("🚨 ไม่สามารถฝึกโมเดลได้ - ตรวจสอบข้อมูลในฐานข้อมูล")
         return 1
     
     # Step 5: Final validation
     print("\n📋 ขั้นตอนที่ 5: ตรวจสอบความพร้อมสุดท้าย")
-    if not run_command("python scripts/validate_system.py", "ตรวจสอบระบบหลังการตั้งค่า"):
+    if not run_script("validate_system", "ตรวจสอบระบบหลังการตั้งค่า"):
         print("🚨 ระบบยังไม่พร้อมใช้งาน")
         return 1
     
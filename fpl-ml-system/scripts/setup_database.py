@@ -11,7 +11,9 @@ sys.path.insert(0, str(project_root))
 
 from flask import Flask
 from src.config import get_config
-from src.models.db_models import db
+from src.models.db_models import (
+    db, add_missing_columns, backfill_expected_points, create_player_name_index, create_trigram_extension
+)
 
 
 def create_app() -> Flask:
@@ -42,12 +44,34 @@ def setup_database(app: Flask) -> None:
         # Create all tables
         db.create_all()
         
+        # create_all skips existing tables, so add any newly declared columns and indexes
+        for column in add_missing_columns():
+            print(f"Added column {column}")
+        if db.engine.dialect.name == 'postgresql':
+            with db.engine.begin() as conn:
+                create_trigram_extension(conn)
+        for table in db.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(db.engine, checkfirst=True)
+        if db.engine.dialect.name == 'sqlite':
+            with db.engine.begin() as conn:
+                if not create_player_name_index(conn):
+                    print("WARNING: SQLite lacks FTS5 trigram support, name search will use LIKE")
+        backfilled = backfill_expected_points()
+        if backfilled:
+            print(f"Backfilled expected points for {backfilled} players")
+        
         # Enable foreign key constraints for SQLite
         if 'sqlite' in app.config['SQLALCHEMY_DATABASE_URI']:
             print("Enabling foreign key constraints for SQLite...")
             with db.engine.connect() as conn:
                 conn.execute(db.text('PRAGMA foreign_keys = ON;'))
         
+        # Refresh planner statistics so the composite indexes are picked
+        print("Analyzing tables...")
+        with db.engine.begin() as conn:
+            conn.execute(db.text('ANALYZE'))
+        
         print("Database setup completed successfully!")
         
         # Print table information
@@ -58,9 +82,9 @@ def setup_database(app: Flask) -> None:
         
         # Verify indexes
         print("\nVerifying indexes:")
-        players_indexes = inspector.get_indexes('players')
-        for index in players_indexes:
-            print(f"  - players.{index['name']}: {index['column_names']}")
+        for table_name in ('players', 'fixtures'):
+            for index in inspector.get_indexes(table_name):
+                print(f"  - {table_name}.{index['name']}: {index['column_names']}")
 
 
 def seed_initial_data(app: Flask) -> None:
@@ -16,19 +16,16 @@ sys.path.insert(0, str(project_root))
 from flask import Flask
 from src.config import get_config
 from src.models.db_models import db
+from src.queued_logging import setup_queued_logging
 from src.services.prediction_service import PredictionService
 
 
 def setup_logging(log_level: str = 'INFO'):
     """Set up logging configuration."""
-    logging.basicConfig(
-        level=getattr(logging, log_level.upper()),
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.StreamHandler(sys.stdout),
-            logging.FileHandler('logs/train_models.log')
-        ]
-    )
+    # main() is also called in-process by quick_start and maintenance, so
+    # the directory can't be left to the __main__ block
+    os.makedirs('logs', exist_ok=True)
+    setup_queued_logging(log_level, 'logs/train_models.log')
 
 
 def create_app() -> Flask:
@@ -206,8 +203,8 @@ def save_training_report(results: dict, output_file: str = None):
     print(f"Training report saved to: {output_file}")
 
 
-def main():
-    """Main function."""
+def main(argv=None):
+    """Main function; ``argv`` defaults to the command line arguments."""
     parser = argparse.ArgumentParser(description='Train ML models for FPL player prediction')
     
     parser.add_argument(
@@ -257,7 +254,7 @@ def main():
         help='Output file path for training report'
     )
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     # Set up logging
     setup_logging(args.log_level)
@@ -357,7 +354,4 @@ def main():
 
 
 if __name__ == '__main__':
-    # Ensure logs directory exists
-    os.makedirs('logs', exist_ok=True)
-    
     sys.exit(main())
\ No newline at end of file
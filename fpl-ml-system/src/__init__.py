@@ -8,22 +8,10 @@ from flask import Flask, render_template
 from flask_migrate import Migrate
 import click
 
-# Simple cache implementation for now
-class SimpleCache:
-    def __init__(self, app=None):
-        self.cache_data = {}
-        
-    def get(self, key):
-        return self.cache_data.get(key)
-        
-    def set(self, key, value, timeout=None):
-        self.cache_data[key] = value
-        
-    def clear(self):
-        self.cache_data.clear()
-
+from .cache import SimpleCache
 from .config import get_config
-from .models.db_models import db
+from .json_provider import init_json_provider
+from .models.db_models import db, upgrade_schema
 
 
 def create_app(config_name=None):
@@ -45,11 +33,12 @@ def create_app(config_name=None):
     
     config = get_config(config_name)
     app.config.from_object(config)
+    init_json_provider(app)
     
     # Initialize extensions
     db.init_app(app)
     migrate = Migrate(app, db)
-    cache = SimpleCache(app)
+    cache = SimpleCache()
     
     # Initialize services with app context (with fallback for ML issues)
     from .services.data_service import DataService
@@ -140,8 +129,8 @@ def create_app(config_name=None):
     # CLI commands
     @app.cli.command()
     def init_db():
-        """Initialize the database."""
-        db.create_all()
+        """Initialize the database, adding columns missing from existing tables."""
+        upgrade_schema()
         click.echo('Database initialized.')
     
     @app.cli.command()
@@ -0,0 +1,44 @@
+"""In-process cache shared by the apps and scripts."""
+
+import threading
+import time
+from collections import OrderedDict
+
+
+# Simple thread-safe LRU cache with per-key timeout (seconds)
+class SimpleCache:
+    def __init__(self, max_size=1024, default_timeout=300):
+        self.cache_data = OrderedDict()
+        self.max_size = max_size
+        self.default_timeout = default_timeout
+        self._lock = threading.RLock()
+        
+    def get(self, key):
+        with self._lock:
+            entry = self.cache_data.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at is not None and time.monotonic() >= expires_at:
+                del self.cache_data[key]
+                return None
+            self.cache_data.move_to_end(key)
+            return value
+        
+    def set(self, key, value, timeout=None):
+        timeout = self.default_timeout if timeout is None else timeout
+        expires_at = time.monotonic() + timeout if timeout else None
+        with self._lock:
+            self.cache_data[key] = (value, expires_at)
+            self.cache_data.move_to_end(key)
+            # Evict least recently used entries beyond the size bound
+            while len(self.cache_data) > self.max_size:
+                self.cache_data.popitem(last=False)
+        
+    def delete(self, key):
+        with self._lock:
+            self.cache_data.pop(key, None)
+        
+    def clear(self):
+        with self._lock:
+            self.cache_data.clear()
@@ -0,0 +1,45 @@
+"""JSON provider that encodes responses with orjson when it is installed."""
+
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson.
+
+    Output matches the default provider: keys are sorted, dates are passed to
+    the default handler so they keep Flask's HTTP date format, and ``indent``
+    is honoured for debug pretty-printing.
+    """
+
+    OPTIONS = (orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS |
+               orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_PASSTHROUGH_DATETIME) if ORJSON_AVAILABLE else 0
+
+    def _encode(self, obj, indent=False, default=None):
+        option = self.OPTIONS | orjson.OPT_INDENT_2 if indent else self.OPTIONS
+        return orjson.dumps(obj, default=default or self.default, option=option)
+
+    def dumps(self, obj, **kwargs):
+        return self._encode(obj, kwargs.get('indent'), kwargs.get('default')).decode()
+
+    def response(self, *args, **kwargs):
+        """Build a JSON response from orjson's bytes without a ``str`` round trip."""
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        return self._app.response_class(self._encode(obj, indent) + b'\n', mimetype=self.mimetype)
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
+def init_json_provider(app):
+    """Use the orjson provider for the app, keeping Flask's default if orjson is missing."""
+    if ORJSON_AVAILABLE:
+        app.json = OrjsonProvider(app)
+    return app.json
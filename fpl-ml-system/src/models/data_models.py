@@ -132,6 +132,58 @@ class OptimizationRequest(BaseModel):
         return v
 
 
+class TeamOptimizationForm(BaseModel):
+    """Lenient optimization parameters posted by the optimizer page as JSON or form data.
+    
+    Blank or invalid numbers fall back to the defaults, and player lists may be
+    comma-separated strings of names; integer entries are treated as player IDs.
+    """
+    
+    budget: float = 100.0
+    formation: Optional[str] = None
+    preferred_players: Optional[List[Union[int, str]]] = None
+    excluded_players: Optional[List[Union[int, str]]] = None
+    max_players_per_team: int = 3
+    
+    @validator('budget', pre=True)
+    def default_invalid_budget(cls, v):
+        """Use the default budget for blank or non-numeric input."""
+        try:
+            return float(v) if v not in (None, '') else 100.0
+        except (ValueError, TypeError):
+            return 100.0
+    
+    @validator('max_players_per_team', pre=True)
+    def default_invalid_max_players(cls, v):
+        """Use the default team limit for blank or non-integer input."""
+        try:
+            return int(v) if v not in (None, '') else 3
+        except (ValueError, TypeError):
+            return 3
+    
+    @validator('formation', pre=True)
+    def blank_formation_to_none(cls, v):
+        """Treat a blank formation as no formation constraint."""
+        return v or None
+    
+    @validator('preferred_players', 'excluded_players', pre=True)
+    def parse_player_list(cls, v):
+        """Split comma-separated names; numeric tokens become player IDs."""
+        if isinstance(v, str):
+            v = [name.strip() for name in v.split(',') if name.strip()]
+        if not v:
+            return None
+        players = []
+        for item in v:
+            if isinstance(item, int):
+                players.append(item)
+                continue
+            token = str(item).strip()
+            # Branch on the token shape instead of int() inside try/except
+            players.append(int(token) if token.lstrip('-').isdigit() else token)
+        return players
+
+
 class PlayerSearchRequest(BaseModel):
     """Request parameters for player search."""
     
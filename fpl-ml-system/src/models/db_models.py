@@ -1,14 +1,80 @@
 """SQLAlchemy database models for FPL AI Optimizer."""
 
+import logging
+import sqlite3
+import weakref
 from datetime import datetime
-from typing import Optional
+from typing import Iterable, List, Optional
 
 from flask_sqlalchemy import SQLAlchemy
-from sqlalchemy import Index, JSON
+from sqlalchemy import Index, JSON, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import OperationalError
+
+logger = logging.getLogger(__name__)
 
 db = SQLAlchemy()
 
 
+@event.listens_for(Engine, 'connect')
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Use WAL journaling on SQLite so readers don't block behind a writer.
+    
+    Each connection also gets a 64 MiB page cache, a 256 MiB memory map and
+    in-memory temp tables for sorts. New database files are created in
+    incremental auto-vacuum mode; the pragma has to come before WAL is
+    enabled, and is a no-op on files that already have tables.
+    """
+    if isinstance(dbapi_connection, sqlite3.Connection):
+        cursor = dbapi_connection.cursor()
+        cursor.execute('PRAGMA auto_vacuum=INCREMENTAL')
+        cursor.execute('PRAGMA journal_mode=WAL')
+        cursor.execute('PRAGMA synchronous=NORMAL')
+        cursor.execute('PRAGMA cache_size=-65536')
+        cursor.execute('PRAGMA mmap_size=268435456')
+        cursor.execute('PRAGMA temp_store=MEMORY')
+        cursor.close()
+
+
+def name_starts_with(column, text: str):
+    """Case-insensitive prefix filter for a name column.
+    
+    SQLite serves this from the NOCASE indexes and PostgreSQL from the
+    lower() pattern indexes declared on Player.
+    """
+    if db.engine.dialect.name == 'sqlite':
+        return column.like(f'{text}%')
+    return db.func.lower(column).like(f'{text.lower()}%')
+
+
+def name_contains(column, text: str):
+    """Case-insensitive substring filter for a name column.
+    
+    SQLite's LIKE already ignores ASCII case (and its lower() is ASCII-only),
+    so the per-row lower() calls that ilike() adds are skipped there.
+    """
+    pattern = f'%{text}%'
+    if db.engine.dialect.name == 'sqlite':
+        return column.like(pattern)
+    return column.ilike(pattern)
+
+
+def estimate_expected_points(form) -> float:
+    """Form-based expected points estimate stored on each player."""
+    return max(2.0, float(form or 0) * 2)
+
+
+def _default_expected_points(context) -> float:
+    return estimate_expected_points(context.get_current_parameters().get('form'))
+
+
+def stored_expected_points(row) -> float:
+    """Expected points materialized at ingest, estimated for rows not yet backfilled."""
+    if row.expected_points is not None:
+        return row.expected_points
+    return estimate_expected_points(row.form)
+
+
 class Team(db.Model):
     """Premier League teams model."""
     
@@ -51,6 +117,8 @@ class Player(db.Model):
     form = db.Column(db.Float, default=0.0)
     points_per_game = db.Column(db.Float, default=0.0)
     total_points = db.Column(db.Integer, default=0)
+    # Precomputed at ingest so requests and sorts never estimate per row
+    expected_points = db.Column(db.Float, default=_default_expected_points)
     
     # Playing time
     minutes = db.Column(db.Integer, default=0)
@@ -73,6 +141,30 @@ class Player(db.Model):
         Index('idx_player_web_name', 'web_name'),
         Index('idx_player_team', 'team_id'),
         Index('idx_player_position', 'position'),
+        # Composite indexes for the available-player filters and sorts used on every request
+        Index('idx_player_status_total_points', status, total_points.desc()),
+        Index('idx_player_status_position_total_points', status, position, total_points.desc()),
+        Index('idx_player_status_team_total_points', status, team_id, total_points.desc()),
+        Index('idx_player_status_cost', status, now_cost),
+        Index('idx_player_status_expected_points', status, expected_points.desc()),
+        # Case-insensitive indexes let SQLite serve prefix LIKE searches on names
+        Index('idx_player_web_name_nocase', web_name.collate('NOCASE')).ddl_if(dialect='sqlite'),
+        Index('idx_player_first_name_nocase', first_name.collate('NOCASE')).ddl_if(dialect='sqlite'),
+        Index('idx_player_second_name_nocase', second_name.collate('NOCASE')).ddl_if(dialect='sqlite'),
+        # PostgreSQL equivalents: trigram GIN indexes serve '%term%' ILIKE and
+        # lower() pattern indexes serve anchored prefix searches
+        Index('idx_player_web_name_trgm', 'web_name', postgresql_using='gin',
+              postgresql_ops={'web_name': 'gin_trgm_ops'}).ddl_if(dialect='postgresql'),
+        Index('idx_player_first_name_trgm', 'first_name', postgresql_using='gin',
+              postgresql_ops={'first_name': 'gin_trgm_ops'}).ddl_if(dialect='postgresql'),
+        Index('idx_player_second_name_trgm', 'second_name', postgresql_using='gin',
+              postgresql_ops={'second_name': 'gin_trgm_ops'}).ddl_if(dialect='postgresql'),
+        Index('idx_player_web_name_lower', db.func.lower(web_name).label('lower_web_name'),
+              postgresql_ops={'lower_web_name': 'text_pattern_ops'}).ddl_if(dialect='postgresql'),
+        Index('idx_player_first_name_lower', db.func.lower(first_name).label('lower_first_name'),
+              postgresql_ops={'lower_first_name': 'text_pattern_ops'}).ddl_if(dialect='postgresql'),
+        Index('idx_player_second_name_lower', db.func.lower(second_name).label('lower_second_name'),
+              postgresql_ops={'lower_second_name': 'text_pattern_ops'}).ddl_if(dialect='postgresql'),
     )
     
     def __repr__(self):
@@ -84,6 +176,119 @@ class Player(db.Model):
         return self.now_cost / 10.0
 
 
+# Trigram full-text index over player names; SQLite answers substring MATCH
+# queries from it instead of scanning every row with LIKE '%...%'
+PLAYER_NAME_FTS_TABLE = 'player_name_fts'
+PLAYER_NAME_FTS_MIN_LENGTH = 3  # Trigrams cannot match shorter terms
+
+_PLAYER_NAME_FTS_DDL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS player_name_fts USING fts5("
+    "web_name, first_name, second_name, "
+    "content='players', content_rowid='player_id', tokenize='trigram')",
+    "CREATE TRIGGER IF NOT EXISTS players_name_fts_insert AFTER INSERT ON players BEGIN "
+    "INSERT INTO player_name_fts(rowid, web_name, first_name, second_name) "
+    "VALUES (new.player_id, new.web_name, new.first_name, new.second_name); END",
+    "CREATE TRIGGER IF NOT EXISTS players_name_fts_delete AFTER DELETE ON players BEGIN "
+    "INSERT INTO player_name_fts(player_name_fts, rowid, web_name, first_name, second_name) "
+    "VALUES ('delete', old.player_id, old.web_name, old.first_name, old.second_name); END",
+    "CREATE TRIGGER IF NOT EXISTS players_name_fts_update "
+    "AFTER UPDATE OF player_id, web_name, first_name, second_name ON players BEGIN "
+    "INSERT INTO player_name_fts(player_name_fts, rowid, web_name, first_name, second_name) "
+    "VALUES ('delete', old.player_id, old.web_name, old.first_name, old.second_name); "
+    "INSERT INTO player_name_fts(rowid, web_name, first_name, second_name) "
+    "VALUES (new.player_id, new.web_name, new.first_name, new.second_name); END",
+)
+
+_PLAYER_NAME_FTS_TRIGGERS = ('players_name_fts_insert', 'players_name_fts_delete', 'players_name_fts_update')
+
+# Engines known to have the name index (checked once per engine)
+_player_name_fts_engines = weakref.WeakKeyDictionary()
+
+
+def create_player_name_index(connection) -> bool:
+    """Create the SQLite player name index and its sync triggers, then fill it.
+    
+    Returns False, leaving name lookups on LIKE, when this SQLite build lacks
+    FTS5 or its trigram tokenizer (added in SQLite 3.34).
+    """
+    try:
+        for statement in _PLAYER_NAME_FTS_DDL:
+            connection.exec_driver_sql(statement)
+        connection.exec_driver_sql("INSERT INTO player_name_fts(player_name_fts) VALUES ('rebuild')")
+    except OperationalError as e:
+        logger.warning('Player name index unavailable, name search will use LIKE: %s', e.orig)
+        # Don't leave triggers writing to a missing index
+        for trigger in _PLAYER_NAME_FTS_TRIGGERS:
+            connection.exec_driver_sql(f'DROP TRIGGER IF EXISTS {trigger}')
+        connection.exec_driver_sql(f'DROP TABLE IF EXISTS {PLAYER_NAME_FTS_TABLE}')
+        _player_name_fts_engines[connection.engine] = False
+        return False
+    _player_name_fts_engines[connection.engine] = True
+    return True
+
+
+def create_trigram_extension(connection) -> None:
+    """Enable pg_trgm, which the PostgreSQL name indexes depend on."""
+    connection.exec_driver_sql('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+
+
+@event.listens_for(Player.__table__, 'before_create')
+def _create_trigram_extension(target, connection, **kw):
+    if connection.dialect.name == 'postgresql':
+        create_trigram_extension(connection)
+
+
+@event.listens_for(Player.__table__, 'after_create')
+def _create_player_name_index(target, connection, **kw):
+    if connection.dialect.name == 'sqlite':
+        create_player_name_index(connection)
+
+
+@event.listens_for(Player.__table__, 'before_drop')
+def _drop_player_name_index(target, connection, **kw):
+    if connection.dialect.name == 'sqlite':
+        connection.exec_driver_sql(f'DROP TABLE IF EXISTS {PLAYER_NAME_FTS_TABLE}')
+        _player_name_fts_engines.pop(connection.engine, None)
+
+
+def _has_player_name_index() -> bool:
+    engine = db.engine
+    if engine.dialect.name != 'sqlite':
+        return False
+    if engine not in _player_name_fts_engines:
+        with engine.connect() as conn:
+            _player_name_fts_engines[engine] = conn.exec_driver_sql(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+                (PLAYER_NAME_FTS_TABLE,)
+            ).first() is not None
+    return _player_name_fts_engines[engine]
+
+
+def player_name_contains_any(texts: Iterable[str]):
+    """Filter players whose web, first or second name contains any of ``texts``.
+    
+    Terms of three or more characters are looked up in the trigram name index
+    when the database has one; shorter terms fall back to LIKE.
+    """
+    texts = list(texts)
+    columns = (Player.web_name, Player.first_name, Player.second_name)
+    indexed = []
+    if _has_player_name_index():
+        indexed = [text for text in texts if len(text) >= PLAYER_NAME_FTS_MIN_LENGTH]
+        texts = [text for text in texts if len(text) < PLAYER_NAME_FTS_MIN_LENGTH]
+    
+    clauses = [name_contains(column, text) for text in texts for column in columns]
+    if indexed:
+        # Quote each term so it is matched as a literal substring
+        query = ' OR '.join('"{}"'.format(text.replace('"', '""')) for text in indexed)
+        clauses.append(Player.player_id.in_(
+            db.select(db.literal_column('rowid'))
+            .select_from(db.table(PLAYER_NAME_FTS_TABLE))
+            .where(db.text(f'{PLAYER_NAME_FTS_TABLE} MATCH :name_query').bindparams(name_query=query))
+        ))
+    return db.or_(*clauses)
+
+
 class Fixture(db.Model):
     """FPL fixtures model."""
     
@@ -106,6 +311,13 @@ class Fixture(db.Model):
     past_stats = db.relationship('PlayerPastStats', backref='fixture', lazy=True)
     predictions = db.relationship('PlayerPrediction', backref='fixture', lazy=True)
     
+    # Indexes for performance
+    __table_args__ = (
+        Index('idx_fixture_gameweek_kickoff', 'gameweek', 'kickoff_time'),
+        Index('idx_fixture_home_team', 'home_team_id'),
+        Index('idx_fixture_away_team', 'away_team_id'),
+    )
+    
     def __repr__(self):
         return f'<Fixture GW{self.gameweek}: {self.home_team_id} vs {self.away_team_id}>'
 
@@ -232,4 +444,53 @@ class UserTeam(db.Model):
     )
     
     def __repr__(self):
-        return f'<UserTeam {self.user_id} - GW{self.gameweek}>'
\ No newline at end of file
+        return f'<UserTeam {self.user_id} - GW{self.gameweek}>'
+
+
+def add_missing_columns() -> List[str]:
+    """Add nullable columns declared on the models but missing from existing tables.
+    
+    Returns the ``table.column`` names that were added.
+    """
+    inspector = db.inspect(db.engine)
+    existing_tables = set(inspector.get_table_names())
+    added = []
+    with db.engine.begin() as conn:
+        for table in db.metadata.sorted_tables:
+            if table.name not in existing_tables:
+                continue
+            existing = {column['name'] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing or not column.nullable:
+                    continue
+                column_type = column.type.compile(dialect=db.engine.dialect)
+                conn.execute(db.text(f'ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}'))
+                added.append(f'{table.name}.{column.name}')
+    return added
+
+
+def backfill_expected_points() -> int:
+    """Fill stored expected points for players ingested before the column existed.
+    
+    Returns the number of players updated.
+    """
+    players = Player.query.filter(Player.expected_points.is_(None)).all()
+    for player in players:
+        player.expected_points = estimate_expected_points(player.form)
+    if players:
+        db.session.commit()
+    return len(players)
+
+
+def upgrade_schema() -> None:
+    """Create missing tables and columns and backfill derived values.
+    
+    create_all skips tables that already exist, so databases created before
+    a column was declared get it added here. Safe to run on every start.
+    """
+    db.create_all()
+    for column in add_missing_columns():
+        logger.info('Added column %s', column)
+    backfilled = backfill_expected_points()
+    if backfilled:
+        logger.info('Backfilled expected points for %d players', backfilled)
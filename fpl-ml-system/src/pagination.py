@@ -0,0 +1,67 @@
+"""Keyset (cursor) pagination helpers for SQLAlchemy queries."""
+
+import base64
+import binascii
+import json
+
+from sqlalchemy import and_, false, or_
+
+
+def encode_cursor(values) -> str:
+    """Encode the sort key of the last row on a page as an opaque cursor."""
+    return base64.urlsafe_b64encode(json.dumps(values).encode()).decode()
+
+
+def decode_cursor(cursor: str, columns) -> list:
+    """Decode a cursor from encode_cursor for the given sort columns.
+
+    Raises ValueError unless it holds one value per column, each of the
+    column's type (or null, for nullable columns).
+    """
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (binascii.Error, UnicodeDecodeError, json.JSONDecodeError) as e:
+        raise ValueError(f'Invalid cursor: {e}') from e
+    if not isinstance(values, list) or len(values) != len(columns):
+        raise ValueError('Invalid cursor: wrong number of sort values')
+    for column, value in zip(columns, values):
+        if value is None and column.expression.nullable:
+            continue
+        # JSON writes whole floats like 8.0 back as 8.0, but accept ints too
+        allowed = (int, float) if column.type.python_type is float else column.type.python_type
+        if isinstance(value, bool) or not isinstance(value, allowed):
+            raise ValueError(f'Invalid cursor: bad value for {column.key}')
+    return values
+
+
+def keyset_order(columns, descending: bool) -> list:
+    """ORDER BY clauses for a keyset page; NULLs sort as the smallest value."""
+    clauses = []
+    for column in columns:
+        if not column.expression.nullable:
+            clauses.append(column.desc() if descending else column.asc())
+        else:
+            clauses.append(column.desc().nullslast() if descending else column.asc().nullsfirst())
+    return clauses
+
+
+def keyset_after(columns, values, descending: bool):
+    """Filter for rows after the cursor ``values`` in keyset_order.
+
+    A plain row-value comparison is never true for NULL, so it would skip
+    rows whose nullable sort column is NULL; this spells the NULL cases out.
+    The last column must be non-nullable and unique.
+    """
+    column, value = columns[0], values[0]
+    if value is None:
+        # NULL is the smallest value: nothing comes after it descending
+        beyond = false() if descending else column.isnot(None)
+        equal = column.is_(None)
+    else:
+        beyond = column < value if descending else column > value
+        if descending and column.expression.nullable:
+            beyond = or_(beyond, column.is_(None))
+        equal = column == value
+    if len(columns) == 1:
+        return beyond
+    return or_(beyond, and_(equal, keyset_after(columns[1:], values[1:], descending)))
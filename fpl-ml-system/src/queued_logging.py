@@ -0,0 +1,46 @@
+"""Logging setup that moves handler I/O onto a background thread."""
+
+import atexit
+import logging
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+_listener: Optional[QueueListener] = None
+
+
+def setup_queued_logging(log_level: str, log_file: str) -> QueueListener:
+    """Log to stdout and ``log_file`` through a queue.
+
+    The root logger only enqueues records; a listener thread formats them and
+    does the writes and flushes, so a log call never waits on the file. The
+    listener is stopped at exit, which drains anything still queued.
+
+    Scripts run one after another in the same process (maintenance
+    update_data) share the listener: each call drains the queue into the
+    previous script's file, then switches the listener to ``log_file``.
+    """
+    global _listener
+    formatter = logging.Formatter(LOG_FORMAT)
+    file_handler = logging.FileHandler(log_file)
+    file_handler.setFormatter(formatter)
+
+    if _listener is None:
+        stream_handler = logging.StreamHandler(sys.stdout)
+        stream_handler.setFormatter(formatter)
+        log_queue = queue.SimpleQueue()
+        _listener = QueueListener(log_queue, stream_handler, file_handler)
+        logging.getLogger().addHandler(QueueHandler(log_queue))
+        atexit.register(_listener.stop)
+    else:
+        _listener.stop()
+        stream_handler, previous_file_handler = _listener.handlers
+        previous_file_handler.close()
+        _listener.handlers = (stream_handler, file_handler)
+
+    logging.getLogger().setLevel(getattr(logging, log_level.upper()))
+    _listener.start()
+    return _listener
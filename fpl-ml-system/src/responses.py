@@ -0,0 +1,46 @@
+"""Response helpers for the production app: CORS, streamed JSON and ETags."""
+
+from flask import Response, current_app, request, stream_with_context
+
+CORS_HEADERS = {
+    'Access-Control-Allow-Origin': '*',
+    'Access-Control-Allow-Headers': 'Content-Type',
+    'Access-Control-Allow-Methods': 'GET, POST, OPTIONS'
+}
+
+# Response encodings, preferred first; compressed responses carry ETag "<tag>:<encoding>"
+COMPRESS_ALGORITHMS = ['br', 'gzip']
+
+
+def add_cors_headers(response):
+    """Add CORS headers to response."""
+    response.headers.update(CORS_HEADERS)
+    return response
+
+
+def stream_json_list(key, items, **fields):
+    """Stream a ``{"success": true, "data": {key: [...], **fields}}`` JSON response.
+
+    Items are encoded one at a time as the client reads, so large lists never
+    have to be held as a single encoded buffer.
+    """
+    dumps = current_app.json.dumps
+
+    def generate():
+        yield '{"success": true, "data": {' + dumps(key) + ': ['
+        for index, item in enumerate(items):
+            yield (', ' if index else '') + dumps(item)
+        yield ']'
+        for name, field in fields.items():
+            yield ', ' + dumps(name) + ': ' + dumps(field)
+        yield '}}'
+
+    return Response(stream_with_context(generate()), mimetype='application/json')
+
+
+def matching_etag(etag):
+    """Return the tag the client revalidates with if it is ``etag`` or a compressed variant."""
+    for candidate in (etag, *(f'{etag}:{algorithm}' for algorithm in COMPRESS_ALGORITHMS)):
+        if request.if_none_match.contains(candidate):
+            return candidate
+    return None
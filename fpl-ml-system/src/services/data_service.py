@@ -2,6 +2,7 @@
 
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 
@@ -9,12 +10,27 @@ import requests
 from requests.adapters import HTTPAdapter
 from requests.packages.urllib3.util.retry import Retry
 from flask import current_app
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
-from ..models.db_models import db, Team, Player, Fixture, PlayerPastStats
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+from ..models.db_models import db, estimate_expected_points, name_contains, Team, Player, Fixture, PlayerPastStats
 
 
 logger = logging.getLogger(__name__)
 
+# Dialect INSERT constructs that support ON CONFLICT DO UPDATE
+UPSERT_INSERTS = {
+    'sqlite': sqlite_insert,
+    'postgresql': postgresql_insert,
+}
+
 
 class FPLAPIError(Exception):
     """Custom exception for FPL API errors."""
@@ -109,6 +125,9 @@ class DataService:
             if response.status_code != 200:
                 raise FPLAPIError(f"FPL API returned {response.status_code}: {response.text}")
             
+            # bootstrap-static is a couple of MB; orjson decodes it several times faster
+            if ORJSON_AVAILABLE:
+                return orjson.loads(response.content)
             return response.json()
             
         except requests.exceptions.RequestException as e:
@@ -185,6 +204,7 @@ class DataService:
                     'form': float(player.get('form', '0') or 0),
                     'points_per_game': float(player.get('points_per_game', '0') or 0),
                     'total_points': int(player.get('total_points', 0)),
+                    'expected_points': estimate_expected_points(player.get('form')),
                     
                     # Playing time
                     'minutes': int(player.get('minutes', 0)),
@@ -287,16 +307,23 @@ class DataService:
         }
         
         try:
+            # Fixtures come from their own endpoint, so fetch them while
+            # bootstrap-static (teams and players) loads
+            app = current_app._get_current_object()
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                fixtures_future = executor.submit(self._run_in_app_context, app, self.get_fixture_data)
+                bootstrap_data = self.get_bootstrap_static()
+                fixture_data = fixtures_future.result()
+            
             # Update teams
-            team_data = self.get_team_data()
+            team_data = self._transform_team_data(bootstrap_data.get('teams', []))
             stats['teams_updated'] = self._update_teams(team_data)
             
             # Update players
-            player_data = self.get_player_data()
+            player_data = self._transform_player_data(bootstrap_data.get('elements', []))
             stats['players_updated'] = self._update_players(player_data)
             
             # Update fixtures
-            fixture_data = self.get_fixture_data()
             stats['fixtures_updated'] = self._update_fixtures(fixture_data)
             
             db.session.commit()
@@ -310,71 +337,54 @@ class DataService:
         
         return stats
     
+    @staticmethod
+    def _run_in_app_context(app, func):
+        """Call ``func`` inside ``app``'s context, for use from worker threads."""
+        with app.app_context():
+            return func()
+    
     def _update_teams(self, team_data: List[Dict]) -> int:
         """Update teams in database."""
-        updated_count = 0
-        
-        for team_info in team_data:
-            team = Team.query.filter_by(team_id=team_info['team_id']).first()
-            
-            if team:
-                # Update existing team
-                for key, value in team_info.items():
-                    if hasattr(team, key):
-                        setattr(team, key, value)
-                team.updated_at = datetime.utcnow()
-            else:
-                # Create new team
-                team = Team(**team_info)
-                db.session.add(team)
-            
-            updated_count += 1
-        
-        return updated_count
+        return self._upsert(Team, team_data, 'team_id')
     
     def _update_players(self, player_data: List[Dict]) -> int:
         """Update players in database."""
-        updated_count = 0
-        
-        for player_info in player_data:
-            player = Player.query.filter_by(player_id=player_info['player_id']).first()
-            
-            if player:
-                # Update existing player
-                for key, value in player_info.items():
-                    if hasattr(player, key):
-                        setattr(player, key, value)
-                player.updated_at = datetime.utcnow()
-            else:
-                # Create new player
-                player = Player(**player_info)
-                db.session.add(player)
-            
-            updated_count += 1
-        
-        return updated_count
+        return self._upsert(Player, player_data, 'player_id')
     
     def _update_fixtures(self, fixture_data: List[Dict]) -> int:
         """Update fixtures in database."""
-        updated_count = 0
+        return self._upsert(Fixture, fixture_data, 'fixture_id')
+    
+    def _upsert(self, model, rows: List[Dict], key: str) -> int:
+        """Insert new rows and update existing ones in a single batched statement.
         
-        for fixture_info in fixture_data:
-            fixture = Fixture.query.filter_by(fixture_id=fixture_info['fixture_id']).first()
-            
-            if fixture:
-                # Update existing fixture
-                for key, value in fixture_info.items():
-                    if hasattr(fixture, key):
-                        setattr(fixture, key, value)
-                fixture.updated_at = datetime.utcnow()
-            else:
-                # Create new fixture
-                fixture = Fixture(**fixture_info)
-                db.session.add(fixture)
-            
-            updated_count += 1
+        Runs in the current session transaction; callers commit. Dialects
+        without ``ON CONFLICT`` fall back to merging one row at a time.
+        """
+        table = model.__table__
+        # Keep the last row per key so one statement never touches a row twice
+        rows = list({row[key]: row for row in rows}.values())
+        if not rows:
+            return 0
+        columns = [name for name in rows[0] if name in table.c]
+        rows = [{name: row.get(name) for name in columns} for row in rows]
         
-        return updated_count
+        insert = UPSERT_INSERTS.get(db.engine.dialect.name)
+        if insert is None:
+            for row in rows:
+                db.session.merge(model(**row, updated_at=datetime.utcnow()))
+            return len(rows)
+        
+        stmt = insert(table)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[key],
+            set_={
+                **{name: stmt.excluded[name] for name in columns if name != key},
+                'updated_at': datetime.utcnow()
+            }
+        )
+        db.session.execute(stmt, rows)
+        return len(rows)
     
     def search_players(self, name: Optional[str] = None, position: Optional[str] = None,
                       team_id: Optional[int] = None, limit: int = 20) -> List[Player]:
@@ -383,7 +393,7 @@ class DataService:
         
         if name:
             # Use index on web_name for efficient search
-            query = query.filter(Player.web_name.ilike(f'%{name}%'))
+            query = query.filter(name_contains(Player.web_name, name))
         
         if position:
             query = query.filter(Player.position == position)
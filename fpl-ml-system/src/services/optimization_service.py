@@ -4,6 +4,7 @@ import logging
 from typing import Dict, List, Optional, Tuple, Set
 from datetime import datetime
 
+import numpy as np
 from pulp import LpMaximize, LpProblem, LpVariable, lpSum, LpStatus, value
 from flask import current_app
 
@@ -51,7 +52,7 @@ class OptimizationService:
         Returns:
             Dict with optimized team and metadata
         """
-        logger.info(f"Starting team optimization with budget £{budget}M")
+        logger.debug("Starting team optimization with budget £%sM", budget)
         
         try:
             # Get player predictions and data
@@ -131,7 +132,7 @@ class OptimizationService:
             
             # Check if solution is optimal
             if LpStatus[prob.status] != 'Optimal':
-                logger.warning(f"Optimization status: {LpStatus[prob.status]}")
+                logger.warning("Optimization status: %s", LpStatus[prob.status])
                 if LpStatus[prob.status] == 'Infeasible':
                     raise ValueError("No feasible solution found with given constraints")
             
@@ -199,13 +200,13 @@ class OptimizationService:
                     'transfer_count': len(transfers_out)
                 })
             
-            logger.info(f"Optimization completed: {len(selected_players)} players, "
-                       f"£{total_cost:.1f}M, {expected_points:.2f} points")
+            logger.info("Optimization completed: %d players, £%.1fM, %.2f points",
+                        len(selected_players), total_cost, expected_points)
             
             return result
             
         except Exception as e:
-            logger.error(f"Optimization failed: {e}")
+            logger.error("Optimization failed: %s", e)
             raise
     
     def _get_player_data_for_optimization(self, excluded_players: Optional[List[int]] = None) -> Dict:
@@ -232,13 +233,22 @@ class OptimizationService:
         
         results = query.all()
         
+        # Fallback: estimate points for all players without predictions in one pass
+        missing = [row for row in results if row.expected_points is None]
+        estimates = dict(zip(
+            (row.player_id for row in missing),
+            self._estimate_expected_points_batch(
+                [row.position for row in missing],
+                [row.now_cost for row in missing]
+            ).tolist()
+        ))
+        
         player_data = {}
         for row in results:
-            # Use predicted points or fallback to form-based estimate
+            # Use predicted points or fallback to position/cost-based estimate
             expected_points = row.expected_points
             if expected_points is None:
-                # Fallback: estimate based on total points and cost
-                expected_points = self._estimate_expected_points(row)
+                expected_points = estimates[row.player_id]
             
             player_data[row.player_id] = {
                 'web_name': row.web_name,
@@ -249,24 +259,41 @@ class OptimizationService:
                 'status': row.status
             }
         
-        logger.info(f"Retrieved data for {len(player_data)} players")
+        logger.debug("Retrieved data for %d players", len(player_data))
         return player_data
     
+    # Base points per position for the fallback estimate (unknown positions use 2.0)
+    POSITION_BASE_POINTS = {
+        'GKP': 2.0,
+        'DEF': 2.5,
+        'MID': 3.0,
+        'FWD': 3.5
+    }
+    
     def _estimate_expected_points(self, player_row) -> float:
-        """Estimate expected points when prediction is not available."""
-        # Simple heuristic based on position and cost
-        base_points = {
-            'GKP': 2.0,
-            'DEF': 2.5,
-            'MID': 3.0,
-            'FWD': 3.5
-        }
+        """Estimate expected points when prediction is not available.
         
-        position_base = base_points.get(player_row.position, 2.0)
+        Scalar form of _estimate_expected_points_batch; a one-element array
+        would cost more than the arithmetic.
+        """
+        position_base = self.POSITION_BASE_POINTS.get(player_row.position, 2.0)
         cost_factor = (player_row.now_cost / 10.0) / 5.0  # Normalize by £5M
-        
         return max(0.5, position_base * (1 + cost_factor * 0.5))
     
+    def _estimate_expected_points_batch(self, positions: List[str], costs: List[int]) -> np.ndarray:
+        """Estimate expected points for many players at once.
+        
+        Vectorized version of the position and cost heuristic; ``costs`` are in
+        tenths of a million as stored on the Player model.
+        """
+        position_base = np.array(
+            [self.POSITION_BASE_POINTS.get(position, 2.0) for position in positions],
+            dtype=np.float64
+        )
+        cost_factor = (np.asarray(costs, dtype=np.float64) / 10.0) / 5.0  # Normalize by £5M
+        
+        return np.maximum(0.5, position_base * (1 + cost_factor * 0.5))
+    
     def _select_starting_xi(self, squad_players: List[int], formation: Optional[str], 
                            player_predictions: Dict[int, float], 
                            player_positions: Dict[int, str]) -> List[int]:
@@ -286,7 +313,7 @@ class OptimizationService:
                 else:
                     raise ValueError("Invalid formation")
             except (ValueError, IndexError):
-                logger.warning(f"Invalid formation {formation}, using 3-4-3")
+                logger.warning("Invalid formation %s, using 3-4-3", formation)
                 formation_needs = {'GKP': 1, 'DEF': 3, 'MID': 4, 'FWD': 3}
         else:
             formation_needs = {'GKP': 1, 'DEF': 3, 'MID': 4, 'FWD': 3}  # Default 3-4-3
@@ -357,7 +384,7 @@ class OptimizationService:
         Returns:
             List of transfer suggestions
         """
-        logger.info(f"Analyzing transfer suggestions for team of {len(current_team)} players")
+        logger.debug("Analyzing transfer suggestions for team of %d players", len(current_team))
         
         try:
             # Get current team data
@@ -379,7 +406,10 @@ class OptimizationService:
             current_value = sum(current_costs[pid] for pid in current_team if pid in current_costs)
             available_budget = current_value + budget_available
             
-            suggestions = []
+            # Every squad player shares one alternative pool, loaded once as arrays
+            pool = self._load_transfer_pool(current_team, available_budget)
+            
+            candidates = []
             
             # Analyze each position for potential improvements
             for position in ['GKP', 'DEF', 'MID', 'FWD']:
@@ -387,6 +417,14 @@ class OptimizationService:
                     pid for pid in current_team 
                     if current_positions.get(pid) == position
                 ]
+                if not position_players:
+                    continue
+                
+                # Best alternatives for the position, scored for all squad players at once
+                alternatives = self._top_position_alternatives(pool, position)
+                alt_ids = pool['player_id'][alternatives]
+                alt_points = pool['expected_points'][alternatives]
+                alt_costs = pool['cost'][alternatives]
                 
                 for current_player_id in position_players:
                     if current_player_id not in current_predictions:
@@ -395,33 +433,44 @@ class OptimizationService:
                     current_points = current_predictions[current_player_id]
                     current_cost = current_costs[current_player_id]
                     
-                    # Find better alternatives
-                    alternatives = self._find_position_alternatives(
-                        position, current_cost, available_budget, 
-                        excluded_players=[current_player_id] + [pid for pid in current_team if pid != current_player_id]
-                    )
+                    improvements = alt_points - current_points
+                    cost_changes = alt_costs - current_cost
+                    keep = (improvements >= min_improvement) & (cost_changes <= budget_available)
                     
-                    for alt_player_id, alt_data in alternatives.items():
-                        expected_improvement = alt_data['expected_points'] - current_points
-                        cost_change = alt_data['cost'] - current_cost
-                        
-                        if (expected_improvement >= min_improvement and 
-                            cost_change <= budget_available):
-                            
-                            # Create transfer suggestion
-                            current_player = Player.query.get(current_player_id)
-                            alt_player = Player.query.get(alt_player_id)
-                            
-                            if current_player and alt_player:
-                                suggestion = TransferSuggestion(
-                                    player_out=self._player_to_stats(current_player, current_points),
-                                    player_in=self._player_to_stats(alt_player, alt_data['expected_points']),
-                                    cost_change=cost_change,
-                                    expected_points_gain=expected_improvement,
-                                    reasoning="",  # Will be filled by reasoning service
-                                    confidence_score=min(1.0, expected_improvement / 5.0)
-                                )
-                                suggestions.append(suggestion)
+                    for alt_player_id, alt_expected, cost_change, expected_improvement in zip(
+                        alt_ids[keep].tolist(), alt_points[keep].tolist(),
+                        cost_changes[keep].tolist(), improvements[keep].tolist()
+                    ):
+                        candidates.append((
+                            current_player_id, current_points,
+                            alt_player_id, alt_expected,
+                            cost_change, expected_improvement
+                        ))
+            
+            # Load every player involved in a suggestion with one query
+            involved_ids = {pid for c in candidates for pid in (c[0], c[2])}
+            players_by_id = {
+                player.player_id: player
+                for player in Player.query.filter(Player.player_id.in_(involved_ids)).all()
+            } if involved_ids else {}
+            
+            suggestions = []
+            for (current_player_id, current_points, alt_player_id, alt_points,
+                 cost_change, expected_improvement) in candidates:
+                # Create transfer suggestion
+                current_player = players_by_id.get(current_player_id)
+                alt_player = players_by_id.get(alt_player_id)
+                
+                if current_player and alt_player:
+                    suggestion = TransferSuggestion(
+                        player_out=self._player_to_stats(current_player, current_points),
+                        player_in=self._player_to_stats(alt_player, alt_points),
+                        cost_change=cost_change,
+                        expected_points_gain=expected_improvement,
+                        reasoning="",  # Will be filled by reasoning service
+                        confidence_score=min(1.0, expected_improvement / 5.0)
+                    )
+                    suggestions.append(suggestion)
             
             # Sort by expected points gain
             suggestions.sort(key=lambda x: x.expected_points_gain, reverse=True)
@@ -429,41 +478,44 @@ class OptimizationService:
             # Limit to top suggestions
             suggestions = suggestions[:transfer_limit * 3]  # Show multiple options per transfer slot
             
-            logger.info(f"Generated {len(suggestions)} transfer suggestions")
+            logger.info("Generated %d transfer suggestions", len(suggestions))
             return suggestions
             
         except Exception as e:
-            logger.error(f"Error generating transfer suggestions: {e}")
+            logger.error("Error generating transfer suggestions: %s", e)
             return []
     
-    def _find_position_alternatives(self, position: str, current_cost: float, 
-                                  max_budget: float, excluded_players: List[int]) -> Dict:
-        """Find alternative players for a given position."""
-        query = db.session.query(
+    def _load_transfer_pool(self, excluded_players: List[int], max_budget: float) -> Dict[str, np.ndarray]:
+        """Load available players with predictions as column arrays for vectorized scoring."""
+        rows = db.session.query(
             Player.player_id,
-            Player.web_name,
+            Player.position,
             Player.now_cost,
             PlayerPrediction.expected_points
         ).join(
             PlayerPrediction, Player.player_id == PlayerPrediction.player_id
         ).filter(
-            Player.position == position,
             Player.status == 'a',
             ~Player.player_id.in_(excluded_players),
             Player.now_cost / 10.0 <= max_budget
-        ).order_by(
-            PlayerPrediction.expected_points.desc()
-        ).limit(10)  # Top 10 alternatives
+        ).all()
         
-        alternatives = {}
-        for row in query.all():
-            alternatives[row.player_id] = {
-                'web_name': row.web_name,
-                'cost': row.now_cost / 10.0,
-                'expected_points': row.expected_points or 0
-            }
-        
-        return alternatives
+        return {
+            'player_id': np.array([row.player_id for row in rows], dtype=np.int64),
+            'position': np.array([row.position for row in rows], dtype=object),
+            'cost': np.array([row.now_cost for row in rows], dtype=np.float64) / 10.0,
+            'expected_points': np.array([row.expected_points or 0 for row in rows], dtype=np.float64)
+        }
+    
+    @staticmethod
+    def _top_position_alternatives(pool: Dict[str, np.ndarray], position: str,
+                                   limit: int = 10) -> np.ndarray:
+        """Indices into ``pool`` of the highest expected-points players in a position."""
+        indices = np.flatnonzero(pool['position'] == position)
+        if len(indices) > limit:
+            top = np.argpartition(-pool['expected_points'][indices], limit - 1)[:limit]
+            indices = indices[top]
+        return indices[np.argsort(-pool['expected_points'][indices], kind='stable')]
     
     def _player_to_stats(self, player: Player, expected_points: float):
         """Convert Player model to PlayerStats for Pydantic model."""
@@ -493,7 +545,7 @@ class OptimizationService:
         Returns:
             Dict with captain and vice-captain suggestions
         """
-        logger.info(f"Analyzing captain suggestions for {len(team_players)} players")
+        logger.debug("Analyzing captain suggestions for %d players", len(team_players))
         
         try:
             # Get player predictions
@@ -557,13 +609,13 @@ class OptimizationService:
                 )
             }
             
-            logger.info(f"Captain suggestion: {captain_data['web_name']} "
-                       f"({captain_data['captain_points']:.2f} pts)")
+            logger.info("Captain suggestion: %s (%.2f pts)",
+                        captain_data['web_name'], captain_data['captain_points'])
             
             return result
             
         except Exception as e:
-            logger.error(f"Error generating captain suggestions: {e}")
+            logger.error("Error generating captain suggestions: %s", e)
             return {}
     
     def optimize_for_gameweek(self, gameweek: int, 
@@ -582,7 +634,7 @@ class OptimizationService:
         Returns:
             Gameweek-specific optimization result
         """
-        logger.info(f"Optimizing team for gameweek {gameweek}")
+        logger.debug("Optimizing team for gameweek %s", gameweek)
         
         try:
             # Get fixture context for the gameweek
@@ -616,7 +668,7 @@ class OptimizationService:
             return result
             
         except Exception as e:
-            logger.error(f"Gameweek optimization failed: {e}")
+            logger.error("Gameweek optimization failed: %s", e)
             raise
     
     def _get_gameweek_fixture_context(self, gameweek: int) -> Dict:
@@ -624,30 +676,34 @@ class OptimizationService:
         from ..models.db_models import Fixture
         
         fixtures = Fixture.query.filter_by(gameweek=gameweek).all()
-        context = {}
         
+        # Map each team to its fixture, then load all their players in one query
+        team_context = {}
         for fixture in fixtures:
-            # Home team context
-            home_players = Player.query.filter_by(team_id=fixture.home_team_id).all()
-            for player in home_players:
-                context[player.player_id] = {
-                    'fixture_id': fixture.fixture_id,
-                    'is_home': True,
-                    'fixture_difficulty': fixture.home_difficulty or 3,
-                    'opponent_team_id': fixture.away_team_id
-                }
-            
-            # Away team context
-            away_players = Player.query.filter_by(team_id=fixture.away_team_id).all()
-            for player in away_players:
-                context[player.player_id] = {
-                    'fixture_id': fixture.fixture_id,
-                    'is_home': False,
-                    'fixture_difficulty': fixture.away_difficulty or 3,
-                    'opponent_team_id': fixture.home_team_id
-                }
+            team_context[fixture.home_team_id] = {
+                'fixture_id': fixture.fixture_id,
+                'is_home': True,
+                'fixture_difficulty': fixture.home_difficulty or 3,
+                'opponent_team_id': fixture.away_team_id
+            }
+            team_context[fixture.away_team_id] = {
+                'fixture_id': fixture.fixture_id,
+                'is_home': False,
+                'fixture_difficulty': fixture.away_difficulty or 3,
+                'opponent_team_id': fixture.home_team_id
+            }
         
-        return context
+        if not team_context:
+            return {}
+        
+        players = db.session.query(Player.player_id, Player.team_id).filter(
+            Player.team_id.in_(team_context)
+        ).all()
+        
+        return {
+            player.player_id: dict(team_context[player.team_id])
+            for player in players
+        }
     
     def _analyze_fixture_difficulty(self, player_ids: List[int], 
                                   fixture_context: Dict) -> Dict:
@@ -0,0 +1,103 @@
+"""Player and team lookups shared by the production app's views."""
+
+from typing import Dict, List, Tuple
+
+from flask import current_app
+
+from ..models.db_models import db, player_name_contains_any, Player, Team
+
+TEAM_NAMES_CACHE_KEY = 'teams:short_names'
+TEAM_NAMES_CACHE_TIMEOUT = 300
+
+
+def resolve_player_ids(names) -> List[int]:
+    """Resolve player names to player IDs with a single batched query.
+
+    Integer entries are treated as player IDs already. Each name resolves to
+    the first available player with a web, first or second name equal to it,
+    or else the first whose name contains it.
+    """
+    return resolve_player_id_lists(names)[0]
+
+
+def resolve_player_id_lists(*name_lists) -> List[List[int]]:
+    """Resolve several name lists (e.g. preferred and excluded) with one shared query."""
+    # Lower-case each distinct name once; duplicates share one name filter term
+    needles = list(dict.fromkeys(
+        str(name).lower()
+        for names in name_lists if names
+        for name in names if not isinstance(name, int)
+    ))
+    candidates = []
+    if needles:
+        rows = db.session.query(
+            Player.player_id,
+            Player.web_name,
+            Player.first_name,
+            Player.second_name
+        ).filter(
+            Player.status == 'a',
+            player_name_contains_any(needles)
+        ).order_by(Player.player_id).all()
+        # Lower-case candidate names once rather than per name compared
+        candidates = [
+            (row.player_id, tuple((field or '').lower() for field in row[1:]))
+            for row in rows
+        ]
+
+    # An exact name beats a substring match, e.g. 'Son' should not pick 'Johnson'
+    matches = {}
+    for needle in needles:
+        player_id = next((pid for pid, fields in candidates if needle in fields), None)
+        if player_id is None:
+            player_id = next((
+                pid for pid, fields in candidates
+                if any(needle in field for field in fields)
+            ), None)
+        matches[needle] = player_id
+
+    resolved = []
+    for names in name_lists:
+        player_ids = []
+        seen = set()
+        for name in names or ():
+            player_id = name if isinstance(name, int) else matches[str(name).lower()]
+            if player_id is not None and player_id not in seen:
+                seen.add(player_id)
+                player_ids.append(player_id)
+        resolved.append(player_ids)
+
+    return resolved
+
+
+def get_team_names() -> Dict[int, str]:
+    """Return ``{team_id: short_name}`` for all teams, cached on the app for 5 minutes.
+
+    Teams only change on data refresh, which clears the app cache.
+    """
+    team_names = current_app.cache.get(TEAM_NAMES_CACHE_KEY)
+    if team_names is None:
+        team_names = dict(db.session.query(Team.team_id, Team.short_name).all())
+        current_app.cache.set(TEAM_NAMES_CACHE_KEY, team_names, timeout=TEAM_NAMES_CACHE_TIMEOUT)
+    return team_names
+
+
+def count_players_and_teams() -> Tuple[int, int]:
+    """Return ``(player_count, team_count)`` from a single statement."""
+    return db.session.query(
+        db.select(db.func.count()).select_from(Player).scalar_subquery(),
+        db.select(db.func.count()).select_from(Team).scalar_subquery()
+    ).one()
+
+
+def get_players_data_version() -> str:
+    """Return a token that changes whenever player rows are added, removed or updated.
+
+    Computed per request rather than cached: the fetch script writes from
+    another process, which can't clear this app's cache, and a stale
+    version would keep answering 304 for data that has changed.
+    """
+    count, last_updated = db.session.query(
+        db.func.count(Player.player_id), db.func.max(Player.updated_at)
+    ).one()
+    return f'{count}:{last_updated}'
@@ -6,7 +6,7 @@ import random
 
 from flask import current_app
 
-from ..models.db_models import db, Player, Team, Fixture
+from ..models.db_models import db, stored_expected_points, Player, Team, Fixture
 from ..models.data_models import OptimizedTeam, TransferSuggestion, CaptainSuggestion
 
 
@@ -420,7 +420,8 @@ class ReasoningService:
             Player.total_points,
             Player.now_cost,
             Player.expected_goals,
-            Player.expected_assists
+            Player.expected_assists,
+            Player.expected_points
         ).filter(
             Player.player_id.in_(player_ids)
         )
@@ -435,7 +436,7 @@ class ReasoningService:
                 'cost': row.now_cost / 10.0,
                 'expected_goals': float(row.expected_goals or 0),
                 'expected_assists': float(row.expected_assists or 0),
-                'expected_points': float(row.form or 0) * 2  # Simplified estimation
+                'expected_points': stored_expected_points(row)
             }
         
         return player_data
@@ -275,7 +275,7 @@ def optimize_team():
         return response
         
     try:
-        logger.info("Team optimization API called")
+        logger.debug("Team optimization API called")
         
         # Get request data
         request_data = request.get_json()
@@ -289,7 +289,7 @@ def optimize_team():
         if not request_data:
             request_data = {}
         
-        logger.info(f"Request data: {request_data}")
+        logger.debug("Request data: %s", request_data)
         
         # Check if services exist
         if not hasattr(current_app, 'optimization_service'):
@@ -310,7 +310,7 @@ def optimize_team():
         optimization_service = current_app.optimization_service
         reasoning_service = current_app.reasoning_service
         
-        logger.info("Starting team optimization...")
+        logger.debug("Starting team optimization...")
         
         # Perform optimization
         result = optimization_service.optimize_team(
@@ -321,24 +321,21 @@ def optimize_team():
             max_players_per_team=request_data.get('max_players_per_team', 3)
         )
         
-        logger.info("Optimization completed, generating reasoning...")
+        logger.debug("Optimization completed, generating reasoning...")
         
         # Generate simple reasoning with detailed error handling
         try:
-            logger.info("Generating reasoning...")
             reasoning = reasoning_service.generate_team_reasoning(result)
             result['reasoning'] = reasoning
-            logger.info("Reasoning generated successfully")
+            logger.debug("Reasoning generated successfully")
         except Exception as reasoning_error:
-            logger.error(f"Reasoning generation failed: {reasoning_error}")
-            import traceback
-            logger.error(f"Reasoning traceback: {traceback.format_exc()}")
+            logger.exception("Reasoning generation failed: %s", reasoning_error)
             # Provide fallback reasoning
             total_cost = result.get('total_cost', 0)
             expected_points = result.get('expected_points', 0)
             result['reasoning'] = f"ทีมที่แนะนำใช้งบ £{total_cost:.1f}M คาดหวัง {expected_points:.1f} แต้ม ได้รับการปรับให้เหมาะสมแล้วด้วย AI"
         
-        logger.info("Team optimization API completed successfully")
+        logger.debug("Team optimization API completed successfully")
         
         response = jsonify(APIResponse(
             success=True,
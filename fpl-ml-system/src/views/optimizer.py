@@ -2,6 +2,7 @@
 
 import logging
 import time
+from collections import Counter
 from datetime import datetime
 from typing import Dict, Any, List
 
@@ -9,7 +10,7 @@ from flask import Blueprint, render_template, request, jsonify, current_app
 from pydantic import ValidationError
 
 from ..models.data_models import OptimizationRequest, APIResponse, ValidationErrorResponse
-from ..models.db_models import Player, Team
+from ..models.db_models import db, Player, Team
 
 
 logger = logging.getLogger(__name__)
@@ -343,8 +344,20 @@ def validate_team_composition(player_ids: List[int]) -> Dict[str, Any]:
                 'errors': [f'Team must have exactly 15 players, got {len(player_ids)}']
             }
         
-        # Get player information
-        players = Player.query.filter(Player.player_id.in_(player_ids)).all()
+        # Get the columns the checks need, with team names, in one query
+        players = db.session.query(
+            Player.player_id,
+            Player.web_name,
+            Player.position,
+            Player.now_cost,
+            Player.team_id,
+            Player.status,
+            Team.name.label('team_name')
+        ).outerjoin(
+            Team, Player.team_id == Team.team_id
+        ).filter(
+            Player.player_id.in_(player_ids)
+        ).all()
         
         if len(players) != len(player_ids):
             return {
@@ -355,25 +368,12 @@ def validate_team_composition(player_ids: List[int]) -> Dict[str, Any]:
         errors = []
         warnings = []
         
-        # Check position constraints
-        position_counts = {}
-        total_cost = 0
-        team_counts = {}
-        unavailable_players = []
-        
-        for player in players:
-            # Count positions
-            position_counts[player.position] = position_counts.get(player.position, 0) + 1
-            
-            # Calculate total cost
-            total_cost += player.now_cost / 10.0
-            
-            # Count players per team
-            team_counts[player.team_id] = team_counts.get(player.team_id, 0) + 1
-            
-            # Check availability
-            if player.status != 'a':
-                unavailable_players.append(player.web_name)
+        # Tally positions, clubs, cost and availability over the squad
+        position_counts = Counter(player.position for player in players)
+        team_counts = Counter(player.team_id for player in players)
+        team_names = {player.team_id: player.team_name for player in players}
+        total_cost = sum(player.now_cost for player in players) / 10.0
+        unavailable_players = [player.web_name for player in players if player.status != 'a']
         
         # Validate formation constraints
         required_positions = {'GKP': 2, 'DEF': 5, 'MID': 5, 'FWD': 3}
@@ -389,8 +389,7 @@ def validate_team_composition(player_ids: List[int]) -> Dict[str, Any]:
         # Validate team constraints (max 3 per team)
         for team_id, count in team_counts.items():
             if count > 3:
-                team = Team.query.get(team_id)
-                team_name = team.name if team else f'Team {team_id}'
+                team_name = team_names[team_id] or f'Team {team_id}'
                 errors.append(f'Too many players from {team_name}: {count} (max 3)')
         
         # Check player availability
@@ -404,7 +403,7 @@ def validate_team_composition(player_ids: List[int]) -> Dict[str, Any]:
             'stats': {
                 'total_cost': round(total_cost, 1),
                 'budget_remaining': round(100.0 - total_cost, 1),
-                'position_counts': position_counts,
+                'position_counts': dict(position_counts),
                 'team_distribution': len(team_counts),
                 'unavailable_count': len(unavailable_players)
             }
@@ -0,0 +1,281 @@
+"""Player list and search API endpoints for the production app."""
+
+import hashlib
+import itertools
+import logging
+
+from flask import Blueprint, Response, jsonify, request
+
+from ..models.db_models import db, name_starts_with, player_name_contains_any, stored_expected_points, Player
+from ..pagination import decode_cursor, encode_cursor, keyset_after, keyset_order
+from ..responses import matching_etag, stream_json_list
+from ..services.player_queries import get_players_data_version, get_team_names
+
+logger = logging.getLogger(__name__)
+
+players_api_bp = Blueprint('players_api', __name__)
+
+# Search terms shorter than this match name prefixes rather than substrings
+MIN_SUBSTRING_SEARCH_LENGTH = 3
+
+VALID_POSITIONS = frozenset({'GKP', 'DEF', 'MID', 'FWD'})
+
+# Player search sort keys
+SEARCH_SORT_FIELDS = {
+    'web_name': Player.web_name,
+    'total_points': Player.total_points,
+    'now_cost': Player.now_cost,
+    'form': Player.form,
+    'expected_points': Player.expected_points
+}
+
+# Player search page size; clients page past the cap with next_cursor
+SEARCH_DEFAULT_LIMIT = 25
+SEARCH_MAX_LIMIT = 100
+
+SEARCH_CACHE_CONTROL = 'private, max-age=60'
+
+
+def parse_fields(value):
+    """Parse a comma-separated ``fields`` parameter; empty means all fields."""
+    if not value:
+        return None
+    return [field.strip() for field in value.split(',') if field.strip()] or None
+
+
+def search_etag(args):
+    """Build a strong ETag for a player search from its query args and the data version."""
+    key = f"{get_players_data_version()}:{sorted(args.items(multi=True))}"
+    return hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+
+
+@players_api_bp.route('/api/players')
+def get_players():
+    """Get players API endpoint."""
+    try:
+        # Parse query parameters
+        position = request.args.get('position')
+        limit = min(int(request.args.get('limit', 50)), 100)
+        offset = int(request.args.get('offset', 0))
+
+        # Build query over the serialized columns only (no ORM object hydration)
+        query = db.session.query(
+            Player.player_id,
+            Player.web_name,
+            Player.first_name,
+            Player.second_name,
+            Player.position,
+            Player.team_id,
+            Player.now_cost,
+            Player.total_points,
+            Player.form,
+            Player.status,
+            # Total matches computed in the same scan as the page
+            db.func.count().over().label('total_count')
+        ).filter(Player.status == 'a')
+
+        if position in VALID_POSITIONS:
+            query = query.filter(Player.position == position)
+
+        # Apply pagination; rows are streamed out as they are read
+        players = iter(query.order_by(Player.player_id).offset(offset).limit(limit).yield_per(200))
+        first_player = next(players, None)
+        if first_player is not None:
+            total_count = first_player.total_count
+            players = itertools.chain([first_player], players)
+        else:
+            # Empty page carries no total, so count separately
+            total_count = query.count()
+
+        def player_dict(row):
+            player = row._asdict()
+            del player['total_count']
+            player['now_cost'] = row.now_cost / 10.0
+            player['form'] = float(row.form or 0)
+            return player
+
+        players_data = (player_dict(row) for row in players)
+
+        return stream_json_list('players', players_data,
+                                total_count=total_count, limit=limit, offset=offset)
+
+    except Exception as e:
+        logger.error("❌ Players API error: %s", e)
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+
+@players_api_bp.route('/api/players/search')
+def search_players():
+    """Advanced player search API endpoint for scouting."""
+    try:
+        logger.debug("🔍 Player search requested...")
+
+        # Parse query parameters
+        position = request.args.get('position')
+        team_id = request.args.get('team_id', type=int)
+        min_cost = request.args.get('min_cost', type=float)
+        max_cost = request.args.get('max_cost', type=float)
+        sort_by = request.args.get('sort_by', 'total_points')
+        sort_order = request.args.get('sort_order', 'desc')
+        limit = max(1, min(int(request.args.get('limit', SEARCH_DEFAULT_LIMIT)), SEARCH_MAX_LIMIT))
+        offset = int(request.args.get('offset', 0))
+        fields = parse_fields(request.args.get('fields'))
+        search_term = request.args.get('q', '').strip()
+        cursor = request.args.get('cursor')
+        include_total = request.args.get('include_total', '').lower() in ('1', 'true', 'yes')
+
+        logger.debug("🔍 Search params: position=%s, team=%s, cost=%s-%s, sort=%s %s",
+                     position, team_id, min_cost, max_cost, sort_by, sort_order)
+
+        # Identical searches against unchanged data are answered without any SQL
+        etag = search_etag(request.args)
+        cached_etag = matching_etag(etag)
+        if cached_etag:
+            response = Response(status=304)
+            response.set_etag(cached_etag)
+            response.headers['Cache-Control'] = SEARCH_CACHE_CONTROL
+            return response
+
+        # Build query over the serialized columns only (no ORM object hydration)
+        query = db.session.query(
+            Player.player_id,
+            Player.web_name,
+            Player.first_name,
+            Player.second_name,
+            Player.position,
+            Player.team_id,
+            Player.now_cost,
+            Player.total_points,
+            Player.form,
+            Player.expected_points,
+            Player.status
+        ).filter(Player.status == 'a')
+
+        # Filter by position
+        if position in VALID_POSITIONS:
+            query = query.filter(Player.position == position)
+
+        # Filter by team
+        if team_id:
+            query = query.filter(Player.team_id == team_id)
+
+        # Filter by cost range
+        if min_cost is not None:
+            query = query.filter(Player.now_cost >= min_cost * 10)
+        if max_cost is not None:
+            query = query.filter(Player.now_cost <= max_cost * 10)
+
+        # Search by player name; very short terms match name prefixes, which the
+        # case-insensitive name indexes can serve, longer ones use the trigram index
+        if search_term:
+            if len(search_term) < MIN_SUBSTRING_SEARCH_LENGTH:
+                query = query.filter(
+                    db.or_(
+                        name_starts_with(Player.web_name, search_term),
+                        name_starts_with(Player.first_name, search_term),
+                        name_starts_with(Player.second_name, search_term)
+                    )
+                )
+            else:
+                query = query.filter(player_name_contains_any([search_term]))
+
+        # Sort results; player_id breaks ties so keyset pages are stable
+        sort_columns = [Player.player_id]
+        if sort_by in SEARCH_SORT_FIELDS:
+            sort_columns.insert(0, SEARCH_SORT_FIELDS[sort_by])
+        descending = sort_order.lower() == 'desc'
+
+        # Counting scans the whole filtered set, so only do it on request; cursor
+        # pages count before the cursor filter narrows the set
+        total_count = query.count() if include_total and cursor else None
+
+        # Keyset pagination: continue after the last row of the previous page
+        if cursor:
+            try:
+                cursor_values = decode_cursor(cursor, sort_columns)
+            except ValueError:
+                return jsonify({'success': False, 'error': 'Invalid cursor'}), 400
+            query = query.filter(keyset_after(sort_columns, cursor_values, descending))
+
+        query = query.order_by(*keyset_order(sort_columns, descending))
+
+        # Apply pagination; one extra row tells whether another page exists
+        if cursor:
+            players = query.limit(limit + 1).all()
+        elif include_total:
+            # Total comes from a window column computed in the same scan as the page
+            players = query.add_columns(
+                db.func.count().over().label('total_count')
+            ).offset(offset).limit(limit + 1).all()
+            # Pages past the end carry no total, so count separately
+            total_count = players[0].total_count if players else query.count()
+        else:
+            players = query.offset(offset).limit(limit + 1).all()
+        has_more = len(players) > limit
+        players = players[:limit]
+
+        next_cursor = None
+        if has_more and players:
+            next_cursor = encode_cursor([getattr(players[-1], column.key) for column in sort_columns])
+
+        # Convert to dict with team names
+        team_names = get_team_names()
+        players_data = []
+        for player in players:
+            team_name = team_names.get(player.team_id, f'Team {player.team_id}')
+
+            players_data.append({
+                'player_id': player.player_id,
+                'web_name': player.web_name,
+                'first_name': player.first_name,
+                'second_name': player.second_name,
+                'position': player.position,
+                'team_id': player.team_id,
+                'team_name': team_name,
+                'now_cost': player.now_cost / 10.0,
+                'total_points': player.total_points,
+                'form': float(player.form or 0),
+                'expected_points': stored_expected_points(player),
+                'status': player.status,
+                'selected_by_percent': getattr(player, 'selected_by_percent', 0.0),
+                'transfers_in': getattr(player, 'transfers_in', 0),
+                'transfers_out': getattr(player, 'transfers_out', 0)
+            })
+
+        # Only send the requested keys; unknown field names are ignored
+        if fields and players_data:
+            fields = [field for field in fields if field in players_data[0]]
+            if fields:
+                players_data = [{field: row[field] for field in fields} for row in players_data]
+
+        logger.debug("✅ Search completed: %d players found", len(players_data))
+
+        response = jsonify({
+            'success': True,
+            'data': {
+                'players': players_data,
+                'total_count': total_count,
+                'limit': limit,
+                'offset': offset,
+                'next_cursor': next_cursor,
+                'has_more': has_more,
+                'filters': {
+                    'position': position,
+                    'team_id': team_id,
+                    'min_cost': min_cost,
+                    'max_cost': max_cost,
+                    'search_term': search_term
+                },
+                'sort': {
+                    'by': sort_by,
+                    'order': sort_order
+                }
+            }
+        })
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = SEARCH_CACHE_CONTROL
+        return response
+
+    except Exception as e:
+        logger.exception("❌ Player search error: %s", e)
+        return jsonify({'success': False, 'error': str(e)}), 500
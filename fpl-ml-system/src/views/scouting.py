@@ -8,13 +8,22 @@ from sqlalchemy import or_, and_, func
 from pydantic import ValidationError
 
 from ..models.data_models import PlayerSearchRequest, PlayerSearchResponse, APIResponse
-from ..models.db_models import db, Player, Team, PlayerPrediction, Fixture, PlayerPastStats
+from ..models.db_models import db, name_contains, Player, Team, PlayerPrediction, Fixture, PlayerPastStats
 
 
 logger = logging.getLogger(__name__)
 
 scouting_bp = Blueprint('scouting', __name__)
 
+# Sortable search fields -> (column, whether NULLs need explicit placement)
+SEARCH_SORT_COLUMNS = {
+    'expected_points': (PlayerPrediction.expected_points, True),
+    'form': (Player.form, True),
+    'total_points': (Player.total_points, False),
+    'now_cost': (Player.now_cost, False),
+    'web_name': (Player.web_name, False),
+}
+
 
 @scouting_bp.route('/')
 def index():
@@ -229,7 +238,7 @@ def perform_player_search(search_request: PlayerSearchRequest) -> PlayerSearchRe
         if search_request.name:
             # Use indexed web_name search for performance
             query = query.filter(
-                Player.web_name.ilike(f'%{search_request.name}%')
+                name_contains(Player.web_name, search_request.name)
             )
         
         if search_request.position:
@@ -248,31 +257,12 @@ def perform_player_search(search_request: PlayerSearchRequest) -> PlayerSearchRe
             query = query.filter(Player.total_points >= search_request.min_points)
         
         # Apply sorting
-        if search_request.sort_by == 'expected_points':
-            if search_request.sort_order == 'desc':
-                query = query.order_by(PlayerPrediction.expected_points.desc().nullslast())
-            else:
-                query = query.order_by(PlayerPrediction.expected_points.asc().nullsfirst())
-        elif search_request.sort_by == 'form':
-            if search_request.sort_order == 'desc':
-                query = query.order_by(Player.form.desc().nullslast())
-            else:
-                query = query.order_by(Player.form.asc().nullsfirst())
-        elif search_request.sort_by == 'total_points':
-            if search_request.sort_order == 'desc':
-                query = query.order_by(Player.total_points.desc())
-            else:
-                query = query.order_by(Player.total_points.asc())
-        elif search_request.sort_by == 'now_cost':
-            if search_request.sort_order == 'desc':
-                query = query.order_by(Player.now_cost.desc())
-            else:
-                query = query.order_by(Player.now_cost.asc())
-        elif search_request.sort_by == 'web_name':
-            if search_request.sort_order == 'desc':
-                query = query.order_by(Player.web_name.desc())
-            else:
-                query = query.order_by(Player.web_name.asc())
+        column, nullable = SEARCH_SORT_COLUMNS[search_request.sort_by]
+        if search_request.sort_order == 'desc':
+            order = column.desc().nullslast() if nullable else column.desc()
+        else:
+            order = column.asc().nullsfirst() if nullable else column.asc()
+        query = query.order_by(order)
         
         # Get total count before limit
         total_count = query.count()
@@ -12,6 +12,7 @@ from flask import Flask
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+from production_app import create_production_app
 from src import create_app
 from src.models.db_models import db, Team, Player, Fixture, PlayerPastStats
 from src.config import TestingConfig
@@ -353,4 +354,59 @@ def mock_requests_get(monkeypatch, mock_fpl_api_response):
     
     import requests
     monkeypatch.setattr(requests, "get", mock_get)
-    return mock_get
\ No newline at end of file
+    return mock_get
+
+
+@pytest.fixture
+def memory_app():
+    """Create an app with its own empty in-memory database."""
+    app = create_app('testing')
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.session.remove()
+        db.drop_all()
+
+
+@pytest.fixture
+def prod_app(tmp_path, monkeypatch):
+    """Create production app backed by a temporary SQLite database."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'instance').mkdir()
+
+    app = create_production_app()
+    app.config['TESTING'] = True
+
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.session.remove()
+        db.drop_all()
+
+
+@pytest.fixture
+def prod_client(prod_app):
+    """Create test client for the production app."""
+    return prod_app.test_client()
+
+
+@pytest.fixture
+def prod_players(prod_app):
+    """Create sample teams and players for the production app."""
+    db.session.add_all([
+        Team(team_id=1, name='Liverpool', short_name='LIV'),
+        Team(team_id=2, name='Arsenal', short_name='ARS'),
+    ])
+    players = [
+        Player(player_id=1, web_name='Salah', first_name='Mohamed', second_name='Salah',
+               team_id=1, position='MID', now_cost=130, total_points=200, form=8.5),
+        Player(player_id=2, web_name='Saka', first_name='Bukayo', second_name='Saka',
+               team_id=2, position='MID', now_cost=100, total_points=180, form=6.0),
+        Player(player_id=3, web_name='Alexander-Arnold', first_name='Trent', second_name='Alexander-Arnold',
+               team_id=1, position='DEF', now_cost=75, total_points=150, form=4.0),
+        Player(player_id=4, web_name='Injured', first_name='Out', second_name='Injured',
+               team_id=2, position='FWD', now_cost=60, total_points=10, form=0.0, status='i'),
+    ]
+    db.session.add_all(players)
+    db.session.commit()
+    return players
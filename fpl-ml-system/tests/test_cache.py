@@ -0,0 +1,44 @@
+"""Tests for the bounded TTL cache."""
+
+from src import cache as cache_module
+from src.cache import SimpleCache
+
+
+class TestSimpleCache:
+    """Test SimpleCache expiry, eviction and invalidation."""
+
+    def test_cache_timeout_expires(self, monkeypatch):
+        """Test that cache entries expire after their timeout."""
+        now = [1000.0]
+        monkeypatch.setattr(cache_module.time, 'monotonic', lambda: now[0])
+        cache = SimpleCache()
+        cache.set('key', 'value', timeout=60)
+        cache.set('forever', 'value')
+
+        assert cache.get('key') == 'value'
+        now[0] += 60
+        assert cache.get('key') is None
+        assert cache.get('forever') == 'value'
+
+    def test_cache_evicts_least_recently_used(self):
+        """Test that the cache stays within its size bound."""
+        cache = SimpleCache(max_size=2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        assert cache.get('a') == 1
+        cache.set('c', 3)
+
+        assert cache.get('b') is None
+        assert cache.get('a') == 1
+        assert cache.get('c') == 3
+
+    def test_cache_delete(self):
+        """Test that a single entry can be invalidated."""
+        cache = SimpleCache()
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.delete('a')
+        cache.delete('missing')
+
+        assert cache.get('a') is None
+        assert cache.get('b') == 2
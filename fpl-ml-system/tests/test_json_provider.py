@@ -0,0 +1,32 @@
+"""Tests for the orjson-backed JSON provider."""
+
+
+class TestJsonProvider:
+    """Test the orjson-backed JSON provider."""
+
+    def test_matches_default_provider(self, prod_app):
+        """Test that orjson output decodes the same as the default provider."""
+        from datetime import datetime
+        from decimal import Decimal
+        from flask.json.provider import DefaultJSONProvider
+        from src.json_provider import OrjsonProvider
+
+        assert isinstance(prod_app.json, OrjsonProvider)
+        payload = {'b': [1, 2.5, None], 'a': {3: 'three'}, 'when': datetime(2024, 8, 16, 19, 0),
+                   'cost': Decimal('13.0')}
+        default = DefaultJSONProvider(prod_app)
+
+        assert prod_app.json.dumps(payload) == default.dumps(payload, separators=(',', ':'))
+        assert prod_app.json.loads(prod_app.json.dumps(payload)) == default.loads(default.dumps(payload))
+
+    def test_response_matches_default_provider(self, prod_app):
+        """Test that jsonify bodies are byte-identical to the default provider's."""
+        from flask.json.provider import DefaultJSONProvider
+
+        payload = {'players': [{'web_name': 'Salah', 'now_cost': 13.0}], 'total_count': None}
+        default = DefaultJSONProvider(prod_app)
+
+        with prod_app.app_context():
+            response = prod_app.json.response(payload)
+            assert response.mimetype == 'application/json'
+            assert response.data == default.response(payload).data
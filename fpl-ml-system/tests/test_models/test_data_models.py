@@ -7,7 +7,7 @@ from pydantic import ValidationError
 from src.models.data_models import (
     PlayerStats, TeamData, OptimizedTeam, TransferSuggestion, 
     CaptainSuggestion, OptimizationRequest, PlayerSearchRequest,
-    FixtureData, PlayerPredictionData, APIResponse
+    FixtureData, PlayerPredictionData, APIResponse, TeamOptimizationForm
 )
 
 
@@ -286,6 +286,56 @@ class TestOptimizationRequest:
         assert request.include_reasoning is True
 
 
+class TestTeamOptimizationForm:
+    """Test lenient parsing of optimizer form/JSON input."""
+    
+    def test_form_strings(self):
+        """Test that form-encoded strings are coerced."""
+        form = TeamOptimizationForm(**{
+            "budget": "95.5",
+            "formation": "",
+            "preferred_players": " Salah, Trent ,,",
+            "excluded_players": "",
+            "max_players_per_team": "2"
+        })
+        
+        assert form.budget == 95.5
+        assert form.formation is None
+        assert form.preferred_players == ["Salah", "Trent"]
+        assert form.excluded_players is None
+        assert form.max_players_per_team == 2
+    
+    def test_invalid_numbers_use_defaults(self):
+        """Test that blank or invalid numbers fall back to defaults."""
+        form = TeamOptimizationForm(budget="lots", max_players_per_team="")
+        
+        assert form.budget == 100.0
+        assert form.max_players_per_team == 3
+    
+    def test_json_lists(self):
+        """Test that JSON lists keep integer IDs and names."""
+        form = TeamOptimizationForm(preferred_players=[3, "Saka"], excluded_players=[])
+        
+        assert form.preferred_players == [3, "Saka"]
+        assert form.excluded_players is None
+    
+    def test_numeric_tokens_become_ids(self):
+        """Test that numeric tokens are parsed as player IDs, names kept as text."""
+        form = TeamOptimizationForm(preferred_players="12, Salah, 7", excluded_players=["5", "Saka"])
+        
+        assert form.preferred_players == [12, "Salah", 7]
+        assert form.excluded_players == [5, "Saka"]
+    
+    def test_defaults(self):
+        """Test defaults when nothing is posted."""
+        form = TeamOptimizationForm()
+        
+        assert form.budget == 100.0
+        assert form.formation is None
+        assert form.preferred_players is None
+        assert form.max_players_per_team == 3
+
+
 class TestPlayerSearchRequest:
     """Test PlayerSearchRequest model validation."""
     
@@ -0,0 +1,109 @@
+"""Tests for the SQLAlchemy database models and their SQLite tuning."""
+
+from src.models.db_models import db, Player, Team
+from src.services.player_queries import resolve_player_ids
+
+
+class TestSqlitePragmas:
+    """Test per-connection SQLite tuning."""
+
+    def test_connection_pragmas(self, prod_app):
+        """Test that pooled connections use WAL and the larger caches."""
+        # synchronous=1 is NORMAL and temp_store=2 is MEMORY
+        expected = {'journal_mode': 'wal', 'synchronous': 1, 'cache_size': -65536, 'temp_store': 2}
+
+        with db.engine.connect() as conn:
+            actual = {name: conn.exec_driver_sql(f'PRAGMA {name}').scalar() for name in expected}
+
+        assert actual == expected
+
+    def test_new_database_uses_incremental_auto_vacuum(self, tmp_path):
+        """Test that a freshly created database file is in incremental auto-vacuum mode."""
+        engine = db.create_engine(f"sqlite:///{tmp_path / 'fresh.db'}")
+        try:
+            with engine.connect() as conn:
+                conn.exec_driver_sql('CREATE TABLE t (x)')
+                # 2 is INCREMENTAL
+                assert conn.exec_driver_sql('PRAGMA auto_vacuum').scalar() == 2
+        finally:
+            engine.dispose()
+
+
+class TestPlayerNameIndex:
+    """Test the trigram name index used for substring name lookups."""
+
+    def test_index_kept_in_sync(self, prod_app, prod_players):
+        """Test that inserts, renames and deletes are reflected in name matches."""
+        from src.models.db_models import _has_player_name_index, player_name_contains_any
+
+        assert _has_player_name_index()
+
+        def matching(*texts):
+            return [row.player_id for row in db.session.query(Player.player_id)
+                    .filter(player_name_contains_any(texts)).order_by(Player.player_id)]
+
+        assert matching('ohame', 'ukay') == [1, 2]
+
+        prod_players[1].web_name = 'Starboy'
+        prod_players[1].first_name = 'Bukayo'
+        db.session.delete(prod_players[0])
+        db.session.add(Player(player_id=5, web_name='Mohamed', team_id=2, position='FWD', now_cost=45))
+        db.session.commit()
+
+        assert matching('ohame', 'ukay') == [2, 5]
+        assert matching('tarbo') == [2]
+        assert matching('alah') == []
+
+    def test_like_fallback_without_index(self, prod_app, prod_client, prod_players):
+        """Test that lookups still work on databases created before the index."""
+        from src.models import db_models
+
+        with db.engine.begin() as conn:
+            conn.exec_driver_sql('DROP TABLE player_name_fts')
+        db_models._player_name_fts_engines.pop(db.engine, None)
+
+        assert resolve_player_ids(['ohamed', 'Saka']) == [1, 2]
+        data = prod_client.get('/api/players/search?q=lexander-').get_json()['data']
+        assert [p['player_id'] for p in data['players']] == [3]
+
+    def test_like_fallback_without_trigram_support(self, prod_app, prod_client, monkeypatch, caplog):
+        """Test that create_all still succeeds when SQLite can't build the trigram index."""
+        from src.models import db_models
+
+        db.drop_all()
+        monkeypatch.setattr(db_models, '_PLAYER_NAME_FTS_DDL', (
+            "CREATE VIRTUAL TABLE player_name_fts USING fts5(web_name, tokenize='no_such_tokenizer')",
+        ) + db_models._PLAYER_NAME_FTS_DDL[1:])
+        db.create_all()
+
+        assert 'name search will use LIKE' in caplog.text
+        assert not db_models._has_player_name_index()
+        tables = db.inspect(db.engine).get_table_names()
+        assert 'player_name_fts' not in tables
+        assert not db.session.execute(db.text("SELECT name FROM sqlite_master WHERE type = 'trigger'")).all()
+
+        db.session.add_all([
+            Team(team_id=1, name='Liverpool', short_name='LIV'),
+            Player(player_id=1, web_name='Salah', first_name='Mohamed', second_name='Salah',
+                   team_id=1, position='MID', now_cost=130),
+        ])
+        db.session.commit()
+
+        assert resolve_player_ids(['ohamed']) == [1]
+        data = prod_client.get('/api/players/search?q=sala').get_json()['data']
+        assert [p['player_id'] for p in data['players']] == [1]
+
+    def test_postgresql_name_indexes(self, prod_app):
+        """Test that PostgreSQL gets trigram and prefix name indexes that SQLite skips."""
+        from sqlalchemy.dialects import postgresql
+        from sqlalchemy.schema import CreateIndex
+
+        indexes = {index.name: index for index in Player.__table__.indexes}
+        ddl = str(CreateIndex(indexes['idx_player_web_name_trgm']).compile(dialect=postgresql.dialect()))
+        assert 'USING gin (web_name gin_trgm_ops)' in ddl
+        ddl = str(CreateIndex(indexes['idx_player_web_name_lower']).compile(dialect=postgresql.dialect()))
+        assert '(lower(web_name) text_pattern_ops)' in ddl
+
+        created = {index['name'] for index in db.inspect(db.engine).get_indexes('players')}
+        assert 'idx_player_web_name_nocase' in created
+        assert not {'idx_player_web_name_trgm', 'idx_player_web_name_lower'} & created
@@ -0,0 +1,66 @@
+"""Tests for the keyset pagination helpers."""
+
+import pytest
+from sqlalchemy.dialects import sqlite
+
+from src.models.db_models import Player
+from src.pagination import decode_cursor, encode_cursor, keyset_after, keyset_order
+
+
+class TestCursor:
+    """Test encoding and validating page cursors."""
+
+    def test_round_trip(self):
+        """Test that a cursor decodes back to the sort values it was made from."""
+        columns = [Player.form, Player.player_id]
+        assert decode_cursor(encode_cursor([8.5, 1]), columns) == [8.5, 1]
+        assert decode_cursor(encode_cursor([None, 2]), columns) == [None, 2]
+
+    def test_integer_accepted_for_float_column(self):
+        """Test that whole numbers are accepted for float sort columns."""
+        assert decode_cursor(encode_cursor([8, 1]), [Player.form, Player.player_id]) == [8, 1]
+
+    @pytest.mark.parametrize('values', [
+        [{'$gt': 1}, 1], [[1], 1], ['8.5', 1], [True, 1], [8.5, None], [8.5], 'not-a-list'
+    ])
+    def test_bad_values_rejected(self, values):
+        """Test that values of the wrong type, count or nullability raise ValueError."""
+        with pytest.raises(ValueError):
+            decode_cursor(encode_cursor(values), [Player.form, Player.player_id])
+
+    def test_malformed_cursor_rejected(self):
+        """Test that text that isn't an encoded cursor raises ValueError."""
+        with pytest.raises(ValueError):
+            decode_cursor('not-a-cursor', [Player.player_id])
+
+
+class TestKeyset:
+    """Test the NULL-aware keyset order and filter."""
+
+    @staticmethod
+    def compile(clause):
+        return str(clause.compile(dialect=sqlite.dialect(), compile_kwargs={'literal_binds': True}))
+
+    def test_nullable_columns_place_nulls_smallest(self):
+        """Test that only nullable columns get explicit NULL placement."""
+        columns = [Player.form, Player.player_id]
+
+        assert [self.compile(c) for c in keyset_order(columns, True)] == [
+            'players.form DESC NULLS LAST', 'players.player_id DESC'
+        ]
+        assert [self.compile(c) for c in keyset_order(columns, False)] == [
+            'players.form ASC NULLS FIRST', 'players.player_id ASC'
+        ]
+
+    def test_descending_filter_keeps_null_rows(self):
+        """Test that rows with a NULL sort value still come after a non-NULL cursor."""
+        sql = self.compile(keyset_after([Player.form, Player.player_id], [4.0, 3], True))
+
+        assert 'players.form IS NULL' in sql
+        assert 'players.player_id < 3' in sql
+
+    def test_nothing_after_null_descending(self):
+        """Test that past a NULL cursor value only the NULL rows' tie-breaker is compared."""
+        sql = self.compile(keyset_after([Player.form, Player.player_id], [None, 3], True))
+
+        assert sql == 'players.form IS NULL AND players.player_id < 3'
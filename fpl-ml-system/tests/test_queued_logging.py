@@ -0,0 +1,45 @@
+"""Tests for the queued script logging setup."""
+
+import logging
+
+import pytest
+
+from src import queued_logging
+from src.queued_logging import setup_queued_logging
+
+
+@pytest.fixture
+def fresh_logging(monkeypatch):
+    """Run with no listener installed, restoring the root logger afterwards."""
+    root = logging.getLogger()
+    saved_handlers, saved_level = root.handlers[:], root.level
+    monkeypatch.setattr(queued_logging, '_listener', None)
+    monkeypatch.setattr(queued_logging.atexit, 'register', lambda func: None)
+    yield
+    if queued_logging._listener is not None:
+        queued_logging._listener.stop()
+        for handler in queued_logging._listener.handlers:
+            handler.close()
+    root.handlers[:] = saved_handlers
+    root.setLevel(saved_level)
+
+
+class TestQueuedLogging:
+    """Test logging through the shared queue listener."""
+
+    def test_each_script_writes_its_own_file(self, fresh_logging, tmp_path):
+        """Test that a second setup in the same process switches the log file."""
+        logger = logging.getLogger('scripts.test')
+
+        first = setup_queued_logging('INFO', str(tmp_path / 'fetch.log'))
+        logger.info('fetching')
+        second = setup_queued_logging('DEBUG', str(tmp_path / 'train.log'))
+        logger.debug('training')
+        # Drain the queue; restart so the fixture can stop it again
+        second.stop()
+        second.start()
+
+        assert first is second
+        assert 'fetching' in (tmp_path / 'fetch.log').read_text()
+        assert 'training' not in (tmp_path / 'fetch.log').read_text()
+        assert ' - scripts.test - DEBUG - training' in (tmp_path / 'train.log').read_text()
@@ -330,4 +330,89 @@ class TestDataService:
             
             # Should handle error gracefully
             assert "errors" in result
-            assert result["errors"] > 0
\ No newline at end of file
+            assert result["errors"] > 0
+
+
+class TestDatabaseUpdate:
+    """Test updating the database from FPL API data."""
+
+    def test_players_inserted_then_updated(self, memory_app):
+        """Test that existing players are updated in place and new ones added."""
+        from src.models.db_models import db
+
+        service = memory_app.data_service
+        service._update_teams([{'team_id': 1, 'name': 'Liverpool', 'short_name': 'LIV'}])
+        raw = [
+            {'id': 1, 'web_name': 'Salah', 'team': 1, 'element_type': 3, 'now_cost': 130, 'form': '4.0'},
+            {'id': 2, 'web_name': 'Nunez', 'team': 1, 'element_type': 4, 'now_cost': 75},
+        ]
+        assert service._update_players(service._transform_player_data(raw)) == 2
+        db.session.commit()
+
+        raw[0].update(now_cost=135, form='6.0')
+        raw.append({'id': 3, 'web_name': 'Alisson', 'team': 1, 'element_type': 1, 'now_cost': 55})
+        assert service._update_players(service._transform_player_data(raw)) == 3
+        db.session.commit()
+
+        players = Player.query.order_by(Player.player_id).all()
+        assert [(p.web_name, p.now_cost, p.expected_points) for p in players] == [
+            ('Salah', 135, 12.0), ('Nunez', 75, 2.0), ('Alisson', 55, 2.0)
+        ]
+        assert all(p.created_at and p.updated_at for p in players)
+
+    def test_duplicate_keys_collapsed(self, memory_app):
+        """Test that a batch repeating a key keeps its last row."""
+        from src.models.db_models import db
+
+        service = memory_app.data_service
+        teams = [
+            {'team_id': 1, 'name': 'Arsenal', 'short_name': 'ARS'},
+            {'team_id': 1, 'name': 'Arsenal FC', 'short_name': 'ARS'},
+        ]
+        assert service._update_teams(teams) == 1
+        db.session.commit()
+
+        assert [team.name for team in Team.query.all()] == ['Arsenal FC']
+
+    def test_update_fetches_each_endpoint_once(self, memory_app, monkeypatch):
+        """Test that a full update loads bootstrap-static once, even without a cache."""
+        service = memory_app.data_service
+        service.cache = None
+        responses = {
+            'bootstrap-static/': {
+                'teams': [{'id': 1, 'name': 'Liverpool', 'short_name': 'LIV'},
+                          {'id': 2, 'name': 'Arsenal', 'short_name': 'ARS'}],
+                'elements': [{'id': 1, 'web_name': 'Salah', 'team': 1, 'element_type': 3, 'now_cost': 130}],
+            },
+            'fixtures/': [{'id': 1, 'event': 1, 'team_h': 1, 'team_a': 2}],
+        }
+        calls = []
+
+        def fake_fetch(endpoint):
+            calls.append(endpoint)
+            return responses[endpoint]
+
+        monkeypatch.setattr(service, '_fetch_from_api', fake_fetch)
+
+        stats = service.update_database_from_api()
+
+        assert sorted(calls) == ['bootstrap-static/', 'fixtures/']
+        assert (stats['teams_updated'], stats['players_updated'], stats['fixtures_updated']) == (2, 1, 1)
+        assert Fixture.query.one().home_team_id == 1
+
+    def test_fetch_decodes_response_body(self, memory_app, monkeypatch):
+        """Test that API responses are decoded from the raw body and bad JSON raises FPLAPIError."""
+        from src.services.data_service import FPLAPIError
+
+        pytest.importorskip('orjson')
+        service = memory_app.data_service
+        response = Mock(status_code=200, content=b'{"events": [{"id": 1, "is_current": true}]}')
+        response.json.side_effect = AssertionError('body decoded twice')
+        monkeypatch.setattr(service.session, 'get', lambda url, timeout: response)
+        monkeypatch.setattr('src.services.data_service.time.sleep', lambda seconds: None)
+
+        assert service._fetch_from_api('bootstrap-static/') == {'events': [{'id': 1, 'is_current': True}]}
+
+        response.content = b'{"events": '
+        with pytest.raises(FPLAPIError):
+            service._fetch_from_api('bootstrap-static/')
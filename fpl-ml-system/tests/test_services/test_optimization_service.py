@@ -338,4 +338,125 @@ class TestOptimizationService:
             with pytest.raises(Exception) as exc_info:
                 optimization_service.optimize_team(request)
             
-            assert "no players" in str(exc_info.value).lower() or "empty" in str(exc_info.value).lower()
\ No newline at end of file
+            assert "no players" in str(exc_info.value).lower() or "empty" in str(exc_info.value).lower()
+
+
+class TestExpectedPointsEstimate:
+    """Test the fallback expected points heuristic."""
+
+    @pytest.fixture
+    def optimization_service(self):
+        """Create optimization service without an app."""
+        return OptimizationService()
+
+    def test_batch_matches_scalar(self, optimization_service):
+        """Test that the batch estimate agrees with the per-player estimate."""
+        positions = ['GKP', 'DEF', 'MID', 'FWD', 'UNK']
+        costs = [45, 55, 130, 115, 50]
+
+        batch = optimization_service._estimate_expected_points_batch(positions, costs)
+        scalar = [
+            optimization_service._estimate_expected_points(Mock(position=position, now_cost=cost))
+            for position, cost in zip(positions, costs)
+        ]
+
+        assert batch.tolist() == pytest.approx(scalar)
+        assert batch[2] == pytest.approx(3.0 * (1 + 2.6 * 0.5))
+
+    def test_batch_empty(self, optimization_service):
+        """Test that an empty batch returns an empty result."""
+        assert optimization_service._estimate_expected_points_batch([], []).tolist() == []
+
+    def test_scalar_estimate_is_plain_float(self, optimization_service):
+        """Test that the single-player estimate returns a Python float, not a NumPy scalar."""
+        estimate = optimization_service._estimate_expected_points(Mock(position='MID', now_cost=80))
+
+        assert type(estimate) is float
+        assert estimate == pytest.approx(3.0 * (1 + 1.6 * 0.5))
+
+
+class TestGameweekFixtureContext:
+    """Test per-player fixture context for a gameweek."""
+
+    @pytest.fixture
+    def fixture_app(self, memory_app):
+        """Seed an in-memory database with teams, players and fixtures."""
+        from src.models.db_models import db, Team, Player, Fixture
+
+        db.session.add_all([
+            Team(team_id=3, name='Manchester City', short_name='MCI'),
+            Team(team_id=4, name='Liverpool', short_name='LIV'),
+            Team(team_id=5, name='Manchester United', short_name='MUN'),
+            Player(player_id=101, web_name='Haaland', team_id=3, position='FWD', now_cost=140),
+            Player(player_id=102, web_name='Salah', team_id=4, position='MID', now_cost=130),
+            Player(player_id=103, web_name='Fernandes', team_id=5, position='MID', now_cost=85),
+            Fixture(fixture_id=2, gameweek=1, home_team_id=3, away_team_id=4,
+                    home_difficulty=5, away_difficulty=4),
+        ])
+        db.session.commit()
+        return memory_app
+
+    def test_context_for_home_and_away_players(self, fixture_app):
+        """Test that players get their team's fixture for the gameweek."""
+        context = OptimizationService()._get_gameweek_fixture_context(1)
+
+        # Man City host Liverpool in gameweek 1; Man United have no fixture
+        assert set(context) == {101, 102}
+        assert context[101] == {'fixture_id': 2, 'is_home': True,
+                                'fixture_difficulty': 5, 'opponent_team_id': 4}
+        assert context[102] == {'fixture_id': 2, 'is_home': False,
+                                'fixture_difficulty': 4, 'opponent_team_id': 3}
+
+    def test_no_fixtures(self, fixture_app):
+        """Test that a gameweek without fixtures gives an empty context."""
+        assert OptimizationService()._get_gameweek_fixture_context(38) == {}
+
+
+class TestTransferPool:
+    """Test the vectorized transfer alternative pool."""
+
+    @pytest.fixture
+    def pool_app(self, memory_app):
+        """Seed an in-memory database with predicted players."""
+        from src.models.db_models import db, Team, Player, PlayerPrediction
+
+        db.session.add_all([
+            Team(team_id=3, name='Manchester City', short_name='MCI'),
+            Player(player_id=201, web_name='Owned', team_id=3, position='MID', now_cost=80),
+            Player(player_id=202, web_name='Cheap', team_id=3, position='MID', now_cost=50),
+            Player(player_id=203, web_name='Pricey', team_id=3, position='MID', now_cost=150),
+            Player(player_id=204, web_name='Injured', team_id=3, position='MID', now_cost=60,
+                   status='i'),
+            Player(player_id=205, web_name='Keeper', team_id=3, position='GKP', now_cost=45),
+            Player(player_id=206, web_name='Unpredicted', team_id=3, position='MID', now_cost=55),
+        ])
+        db.session.add_all([
+            PlayerPrediction(player_id=pid, expected_points=points)
+            for pid, points in [(201, 5.0), (202, 6.5), (203, 9.0), (204, 7.0), (205, 4.0)]
+        ])
+        db.session.commit()
+        return memory_app
+
+    def test_pool_filters_team_status_and_budget(self, pool_app):
+        """Test that the pool holds available, affordable, predicted non-squad players."""
+        pool = OptimizationService()._load_transfer_pool([201], max_budget=10.0)
+
+        assert sorted(pool['player_id'].tolist()) == [202, 205]
+        by_id = dict(zip(pool['player_id'].tolist(), pool['cost'].tolist()))
+        assert by_id == {202: 5.0, 205: 4.5}
+
+    def test_top_alternatives_ranked_by_expected_points(self):
+        """Test that the best players of a position are returned in descending order."""
+        import numpy as np
+
+        pool = {
+            'player_id': np.array([1, 2, 3, 4, 5]),
+            'position': np.array(['MID', 'DEF', 'MID', 'MID', 'MID'], dtype=object),
+            'cost': np.array([5.0, 4.5, 8.0, 6.0, 7.0]),
+            'expected_points': np.array([3.0, 9.0, 7.5, 6.0, 8.0]),
+        }
+
+        top = OptimizationService._top_position_alternatives(pool, 'MID', limit=2)
+
+        assert pool['player_id'][top].tolist() == [5, 3]
+        assert OptimizationService._top_position_alternatives(pool, 'FWD').tolist() == []
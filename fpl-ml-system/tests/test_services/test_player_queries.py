@@ -0,0 +1,84 @@
+"""Tests for the shared player and team queries."""
+
+from src.models.db_models import db, Player, Team
+from src.services.player_queries import (
+    count_players_and_teams, get_team_names, resolve_player_id_lists, resolve_player_ids
+)
+
+
+class TestResolvePlayerIds:
+    """Test batched player name resolution."""
+
+    def test_empty_names(self, prod_app):
+        """Test that no names resolve to an empty list."""
+        assert resolve_player_ids(None) == []
+        assert resolve_player_ids([]) == []
+
+    def test_matches_any_name_field(self, prod_players):
+        """Test matching on web, first and second name case-insensitively."""
+        assert resolve_player_ids(['salah', 'Trent', 'SAKA']) == [1, 3, 2]
+
+    def test_integer_ids_pass_through(self, prod_players):
+        """Test that integer entries are kept as player IDs."""
+        assert resolve_player_ids([2, 'Salah']) == [2, 1]
+
+    def test_unknown_and_unavailable_players_skipped(self, prod_players):
+        """Test that unmatched names and unavailable players are ignored."""
+        assert resolve_player_ids(['Nobody', 'Injured']) == []
+
+    def test_duplicates_removed(self, prod_players):
+        """Test that names resolving to the same player are deduplicated."""
+        assert resolve_player_ids(['Salah', 'Mohamed', 1]) == [1]
+
+    def test_exact_name_preferred(self, prod_players):
+        """Test that an exact name wins over an earlier substring match."""
+        db.session.add(Player(player_id=5, web_name='Sak', team_id=2, position='FWD', now_cost=45))
+        db.session.commit()
+
+        # 'Saka' (id 2) contains 'sak', but 'Sak' (id 5) is an exact match
+        assert resolve_player_ids(['sak']) == [5]
+
+    def test_lists_resolved_together(self, prod_players):
+        """Test that several lists share one query and keep their own results."""
+        from sqlalchemy import event
+
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(db.engine, 'before_cursor_execute', record)
+        try:
+            preferred, excluded = resolve_player_id_lists(['Salah', 3], ['Saka'])
+        finally:
+            event.remove(db.engine, 'before_cursor_execute', record)
+
+        assert (preferred, excluded) == ([1, 3], [2])
+        assert len(statements) == 1
+        assert resolve_player_id_lists(None, []) == [[], []]
+
+
+class TestCounts:
+    """Test the combined dashboard counts."""
+
+    def test_counts_in_one_statement(self, prod_app, prod_players):
+        """Test that player and team counts come back together."""
+        assert tuple(count_players_and_teams()) == (4, 2)
+
+
+class TestTeamNames:
+    """Test the cached team name map."""
+
+    def test_team_names_cached_until_refresh(self, prod_app, prod_client, prod_players):
+        """Test that team names are loaded once and reloaded after a data refresh."""
+        with prod_app.test_request_context():
+            assert get_team_names() == {1: 'LIV', 2: 'ARS'}
+
+            db.session.add(Team(team_id=3, name='Chelsea', short_name='CHE'))
+            db.session.commit()
+            assert 3 not in get_team_names()
+
+        prod_client.post('/api/data/refresh')
+
+        with prod_app.test_request_context():
+            assert get_team_names()[3] == 'CHE'
@@ -0,0 +1,269 @@
+"""Tests for the player list and search API endpoints."""
+
+import pytest
+
+from src.models.db_models import db, Player
+from src.pagination import encode_cursor
+from src.views import players_api
+
+
+class TestPlayersEndpoint:
+    """Test the streamed players endpoint."""
+
+    def test_streams_available_players(self, prod_client, prod_players):
+        """Test that available players are returned with pagination fields."""
+        response = prod_client.get('/api/players?limit=2')
+
+        assert response.status_code == 200
+        assert response.is_streamed
+        data = response.get_json()
+        assert data['success'] is True
+        assert [p['player_id'] for p in data['data']['players']] == [1, 2]
+        assert data['data']['players'][0]['now_cost'] == 13.0
+        assert data['data']['total_count'] == 3
+        assert data['data']['limit'] == 2
+        assert data['data']['offset'] == 0
+
+    def test_empty_result(self, prod_client, prod_players):
+        """Test that filtering to no players yields a valid empty list."""
+        response = prod_client.get('/api/players?position=GKP')
+
+        data = response.get_json()
+        assert data['data']['players'] == []
+        assert data['data']['total_count'] == 0
+
+    def test_total_count_past_last_page(self, prod_client, prod_players):
+        """Test that the total is still reported when the page is empty."""
+        response = prod_client.get('/api/players?offset=10')
+
+        data = response.get_json()
+        assert data['data']['players'] == []
+        assert data['data']['total_count'] == 3
+
+    def test_total_count_with_position_filter(self, prod_client, prod_players):
+        """Test that the total counts all matches, not just the page."""
+        response = prod_client.get('/api/players?position=MID&limit=1&offset=1')
+
+        data = response.get_json()
+        assert [p['player_id'] for p in data['data']['players']] == [2]
+        assert 'total_count' not in data['data']['players'][0]
+        assert data['data']['total_count'] == 2
+
+
+class TestSearchEndpoint:
+    """Test the player search endpoint."""
+
+    def test_search_is_case_insensitive(self, prod_client, prod_players):
+        """Test that the search term matches any name field regardless of case."""
+        response = prod_client.get('/api/players/search?q=mOHAMED')
+
+        data = response.get_json()['data']
+        assert [p['player_id'] for p in data['players']] == [1]
+
+    def test_search_includes_team_names(self, prod_client, prod_players):
+        """Test that each result carries its team's short name."""
+        response = prod_client.get('/api/players/search?sort_by=total_points&include_total=1')
+
+        data = response.get_json()['data']
+        assert [(p['web_name'], p['team_name']) for p in data['players']] == [
+            ('Salah', 'LIV'), ('Saka', 'ARS'), ('Alexander-Arnold', 'LIV')
+        ]
+        assert data['total_count'] == 3
+
+    def test_total_count_opt_in(self, prod_client, prod_players):
+        """Test that the total is only counted when requested."""
+        data = prod_client.get('/api/players/search').get_json()['data']
+
+        assert data['total_count'] is None
+
+    def test_total_count_with_pages(self, prod_client, prod_players):
+        """Test that the total covers the whole filtered set on every page."""
+        first = prod_client.get('/api/players/search?limit=2&include_total=1').get_json()['data']
+        assert len(first['players']) == 2
+        assert first['total_count'] == 3
+
+        after = prod_client.get(
+            f"/api/players/search?limit=2&include_total=1&cursor={first['next_cursor']}"
+        ).get_json()['data']
+        assert after['total_count'] == 3
+
+        past_end = prod_client.get('/api/players/search?offset=5&include_total=1').get_json()['data']
+        assert past_end['players'] == []
+        assert past_end['total_count'] == 3
+
+    def test_keyset_pagination(self, prod_client, prod_players):
+        """Test that following next_cursor walks every page once."""
+        first = prod_client.get('/api/players/search?sort_by=total_points&limit=2').get_json()['data']
+        assert [p['web_name'] for p in first['players']] == ['Salah', 'Saka']
+        assert first['next_cursor']
+        assert first['has_more']
+
+        second = prod_client.get(
+            f"/api/players/search?sort_by=total_points&limit=2&cursor={first['next_cursor']}"
+        ).get_json()['data']
+        assert [p['web_name'] for p in second['players']] == ['Alexander-Arnold']
+        assert second['next_cursor'] is None
+        assert not second['has_more']
+
+    def test_no_cursor_when_page_ends_exactly(self, prod_client, prod_players):
+        """Test that a full last page doesn't send clients after an empty one."""
+        data = prod_client.get('/api/players/search?limit=3').get_json()['data']
+
+        assert len(data['players']) == 3
+        assert data['next_cursor'] is None
+        assert not data['has_more']
+
+    def test_keyset_pagination_ascending(self, prod_client, prod_players):
+        """Test that cursors continue in ascending order too."""
+        first = prod_client.get(
+            '/api/players/search?sort_by=now_cost&sort_order=asc&limit=1'
+        ).get_json()['data']
+        second = prod_client.get(
+            f"/api/players/search?sort_by=now_cost&sort_order=asc&limit=2&cursor={first['next_cursor']}"
+        ).get_json()['data']
+
+        assert [p['web_name'] for p in first['players']] == ['Alexander-Arnold']
+        assert [p['web_name'] for p in second['players']] == ['Saka', 'Salah']
+
+    def test_invalid_cursor(self, prod_client, prod_players):
+        """Test that a malformed cursor is rejected."""
+        response = prod_client.get('/api/players/search?cursor=not-a-cursor')
+
+        assert response.status_code == 400
+        assert response.get_json()['success'] is False
+
+    @pytest.mark.parametrize('values', [
+        [{'$gt': 1}, 1], [[1], 1], [100, 'x'], ['many', 1], [True, 1], [None, None]
+    ])
+    def test_cursor_values_must_match_sort_columns(self, prod_client, prod_players, values):
+        """Test that cursor values of the wrong type are rejected instead of reaching the query."""
+        cursor = encode_cursor(values)
+        response = prod_client.get(f'/api/players/search?sort_by=total_points&cursor={cursor}')
+
+        assert response.status_code == 400
+
+    @pytest.mark.parametrize('sort_order, expected', [
+        ('desc', ['Salah', 'Alexander-Arnold', 'Saka']),
+        ('asc', ['Saka', 'Alexander-Arnold', 'Salah']),
+    ])
+    def test_keyset_pagination_includes_null_sort_values(self, prod_client, prod_players,
+                                                          sort_order, expected):
+        """Test that rows with a NULL sort column are paged through, sorting as the smallest."""
+        prod_players[1].form = None
+        db.session.commit()
+
+        names, cursor = [], ''
+        for _ in range(len(expected)):
+            data = prod_client.get(
+                f'/api/players/search?sort_by=form&sort_order={sort_order}&limit=1&cursor={cursor}'
+            ).get_json()['data']
+            names += [p['web_name'] for p in data['players']]
+            cursor = data['next_cursor']
+
+        assert names == expected
+        assert cursor is None
+
+    def test_short_search_matches_prefix(self, prod_client, prod_players):
+        """Test that terms under three characters match name prefixes only."""
+        response = prod_client.get('/api/players/search?q=al')
+
+        data = response.get_json()['data']
+        # 'Alexander-Arnold' starts with 'al'; 'Salah' only contains it
+        assert [p['web_name'] for p in data['players']] == ['Alexander-Arnold']
+
+    def test_search_special_characters(self, prod_client, prod_players):
+        """Test that hyphenated names are matched as substrings."""
+        response = prod_client.get('/api/players/search?q=alexander-')
+
+        data = response.get_json()['data']
+        assert [p['web_name'] for p in data['players']] == ['Alexander-Arnold']
+
+    def test_sort_by_stored_expected_points(self, prod_client, prod_players):
+        """Test that expected points are stored per player and sorted on in SQL."""
+        # Stored from form on insert: Salah 17.0, Saka 12.0, Alexander-Arnold 8.0
+        prod_players[0].expected_points = 5.0
+        db.session.commit()
+
+        first = prod_client.get('/api/players/search?sort_by=expected_points&limit=2').get_json()['data']
+        rest = prod_client.get(
+            f"/api/players/search?sort_by=expected_points&cursor={first['next_cursor']}"
+        ).get_json()['data']
+
+        assert [(p['web_name'], p['expected_points']) for p in first['players'] + rest['players']] == [
+            ('Saka', 12.0), ('Alexander-Arnold', 8.0), ('Salah', 5.0)
+        ]
+
+    def test_limit_is_capped(self, prod_client, prod_players):
+        """Test that oversized limits are clamped to the maximum page size."""
+        data = prod_client.get('/api/players/search?limit=1000').get_json()['data']
+
+        assert data['limit'] == 100
+
+    @pytest.mark.parametrize('limit', ['0', '-1'])
+    def test_limit_below_one_is_raised(self, prod_client, prod_players, limit):
+        """Test that zero and negative limits are clamped to a single-row page."""
+        response = prod_client.get(f'/api/players/search?sort_by=total_points&limit={limit}')
+
+        assert response.status_code == 200
+        data = response.get_json()['data']
+        assert data['limit'] == 1
+        assert [p['web_name'] for p in data['players']] == ['Salah']
+        assert data['next_cursor']
+
+    def test_fields_projection(self, prod_client, prod_players):
+        """Test that only known requested fields are returned."""
+        response = prod_client.get(
+            '/api/players/search?sort_by=total_points&limit=1&fields=player_id,web_name,bogus'
+        )
+
+        data = response.get_json()['data']
+        assert data['players'] == [{'player_id': 1, 'web_name': 'Salah'}]
+        assert data['next_cursor']
+
+    def test_etag_not_modified(self, prod_client, prod_players, monkeypatch):
+        """Test that a matching If-None-Match is answered with 304 before querying."""
+        first = prod_client.get('/api/players/search?q=salah')
+        etag = first.headers['ETag']
+        assert first.headers['Cache-Control'] == 'private, max-age=60'
+
+        monkeypatch.setattr(players_api, 'get_team_names', lambda: pytest.fail('search ran'))
+        second = prod_client.get('/api/players/search?q=salah', headers={'If-None-Match': etag})
+
+        assert second.status_code == 304
+        assert second.headers['ETag'] == etag
+
+    def test_etag_not_modified_after_compression(self, prod_client, prod_players, monkeypatch):
+        """Test that tags suffixed with a content coding still revalidate early."""
+        etag = prod_client.get('/api/players/search?q=salah').headers['ETag'].strip('"')
+        compressed_etag = f'"{etag}:gzip"'
+
+        monkeypatch.setattr(players_api, 'get_team_names', lambda: pytest.fail('search ran'))
+        response = prod_client.get('/api/players/search?q=salah',
+                                   headers={'If-None-Match': compressed_etag})
+
+        assert response.status_code == 304
+        assert response.headers['ETag'] == compressed_etag
+
+    def test_etag_varies_with_params_and_data(self, prod_app, prod_client, prod_players):
+        """Test that the ETag changes with the query and after a data refresh."""
+        etag = prod_client.get('/api/players/search?q=salah').headers['ETag']
+        assert prod_client.get('/api/players/search?q=saka').headers['ETag'] != etag
+
+        db.session.add(Player(player_id=5, web_name='New', team_id=1, position='FWD', now_cost=50))
+        db.session.commit()
+        prod_app.cache.clear()
+
+        response = prod_client.get('/api/players/search?q=salah', headers={'If-None-Match': etag})
+        assert response.status_code == 200
+        assert response.headers['ETag'] != etag
+
+    def test_etag_changes_when_data_written_elsewhere(self, prod_client, prod_players):
+        """Test that writes that don't clear the app cache (another process) change the ETag."""
+        etag = prod_client.get('/api/players/search?q=salah').headers['ETag']
+
+        prod_players[0].now_cost = 135
+        db.session.commit()
+
+        response = prod_client.get('/api/players/search?q=salah', headers={'If-None-Match': etag})
+        assert response.status_code == 200
+        assert response.headers['ETag'] != etag
@@ -0,0 +1,248 @@
+"""Tests for the production Flask application."""
+
+import pytest
+
+from production_app import create_production_app
+from src.models.db_models import db, Player, Team
+
+
+class TestOptimizeEndpoint:
+    """Test the production optimize endpoint."""
+
+    @pytest.fixture
+    def optimization_result(self):
+        """Fixed optimizer result for the sample players."""
+        return {
+            'players': [1, 2, 3],
+            'starting_xi': [1, 3],
+            'bench': [2],
+            'captain_id': 1,
+            'vice_captain_id': 3,
+            'total_cost': 30.5,
+            'expected_points': 20.0,
+        }
+
+    def test_enriches_squad_players(self, prod_app, prod_client, prod_players,
+                                    optimization_result, monkeypatch):
+        """Test that squad players are enriched with team and role data."""
+        monkeypatch.setattr(prod_app.optimization_service, 'optimize_team',
+                            lambda **kwargs: dict(optimization_result))
+
+        response = prod_client.post('/api/optimize', json={'budget': 100})
+
+        assert response.status_code == 200
+        data = response.get_json()['data']
+        assert [p['player_id'] for p in data['players_data']] == [1, 2, 3]
+        assert [p['team_name'] for p in data['players_data']] == ['LIV', 'ARS', 'LIV']
+        assert [p['player_id'] for p in data['starting_xi_data']] == [1, 3]
+        assert [p['player_id'] for p in data['bench_data']] == [2]
+        assert data['captain_name'] == 'Salah'
+        assert data['vice_captain_name'] == 'Alexander-Arnold'
+
+    def test_passes_resolved_ids_to_optimizer(self, prod_app, prod_client, prod_players,
+                                              optimization_result, monkeypatch):
+        """Test that player names in the request are resolved to IDs."""
+        calls = {}
+
+        def fake_optimize(**kwargs):
+            calls.update(kwargs)
+            return dict(optimization_result)
+
+        monkeypatch.setattr(prod_app.optimization_service, 'optimize_team', fake_optimize)
+
+        response = prod_client.post('/api/optimize', data={
+            'preferred_players': 'Salah, Trent',
+            'excluded_players': 'Saka',
+        })
+
+        assert response.status_code == 200
+        assert calls['preferred_players'] == [1, 3]
+        assert calls['excluded_players'] == [2]
+
+    @pytest.mark.parametrize('payload', [{'formation': 442}, {'formation': ['4-4-2']}])
+    def test_invalid_parameters_rejected(self, prod_app, prod_client, prod_players, payload, monkeypatch):
+        """Test that payloads the request schema rejects get a 400 with per-field errors."""
+        monkeypatch.setattr(prod_app.optimization_service, 'optimize_team',
+                            lambda **kwargs: pytest.fail('optimizer ran'))
+
+        response = prod_client.post('/api/optimize', json=payload)
+
+        assert response.status_code == 400
+        data = response.get_json()
+        assert data['error'] == 'Invalid optimization parameters'
+        assert data['details'][0]['loc'][0] == next(iter(payload))
+        assert 'errors.pydantic.dev' not in response.get_data(as_text=True)
+
+    def test_non_object_body_rejected(self, prod_client, prod_players):
+        """Test that a JSON body that isn't an object gets a 400."""
+        response = prod_client.post('/api/optimize', json=['Salah'])
+
+        assert response.status_code == 400
+        assert response.get_json()['error'] == 'Request body must be a JSON object'
+
+    def test_reasoning_reuses_enriched_players(self, prod_app, prod_client, prod_players,
+                                               optimization_result, monkeypatch):
+        """Test that reasoning is given the enriched rows instead of querying again."""
+        monkeypatch.setattr(prod_app.optimization_service, 'optimize_team',
+                            lambda **kwargs: dict(optimization_result))
+
+        def fail(player_ids):
+            raise AssertionError('reasoning should not reload players')
+
+        monkeypatch.setattr(prod_app.reasoning_service, '_get_player_reasoning_data', fail)
+
+        response = prod_client.post('/api/optimize', json={'budget': 100})
+
+        assert response.status_code == 200
+        assert 'Salah' in response.get_json()['data']['reasoning']
+
+
+class TestDashboardCache:
+    """Test caching of dashboard stats."""
+
+    def test_dashboard_stats_cached(self, prod_app, prod_client, prod_players):
+        """Test that dashboard stats are reused until the cache is cleared."""
+        assert prod_client.get('/').status_code == 200
+        cached = prod_app.cache.get('dashboard:v1')
+        assert cached['stats']['total_players'] == 4
+        assert [p['web_name'] for p in cached['top_players']] == ['Salah', 'Saka', 'Alexander-Arnold']
+        assert [p['team'] for p in cached['top_players']] == ['LIV', 'ARS', 'LIV']
+
+        db.session.add(Player(player_id=5, web_name='New', team_id=1, position='FWD', now_cost=50))
+        db.session.commit()
+
+        health = prod_client.get('/api/health').get_json()
+        assert health['database']['player_count'] == 4
+
+        assert prod_client.post('/api/data/refresh').status_code == 200
+        assert prod_app.cache.get('dashboard:v1') is None
+        assert prod_app.cache.get('dashboard:html') is None
+        health = prod_client.get('/api/health').get_json()
+        assert health['database']['player_count'] == 5
+
+    def test_dashboard_html_cached(self, prod_app, prod_client, prod_players, monkeypatch):
+        """Test that a cached dashboard is served without re-rendering."""
+        import production_app
+
+        first = prod_client.get('/')
+        assert prod_app.cache.get('dashboard:html') == first.get_data(as_text=True)
+
+        def fail(*args, **kwargs):
+            raise AssertionError('dashboard should not be re-rendered')
+
+        monkeypatch.setattr(production_app, 'render_template', fail)
+        second = prod_client.get('/')
+
+        assert second.status_code == 200
+        assert second.content_type == 'text/html; charset=utf-8'
+        assert second.get_data() == first.get_data()
+
+
+class TestTeamsEndpoint:
+    """Test the teams endpoint."""
+
+    def test_teams_ordered_by_name(self, prod_client, prod_players):
+        """Test that teams are returned as plain dicts ordered by name."""
+        response = prod_client.get('/api/teams')
+
+        data = response.get_json()['data']
+        assert [team['short_name'] for team in data] == ['ARS', 'LIV']
+        assert set(data[0]) == {'team_id', 'name', 'short_name',
+                                'strength_overall_home', 'strength_overall_away'}
+
+    def test_teams_cached_until_refresh(self, prod_client, prod_players):
+        """Test that the team list is served from cache until a data refresh."""
+        prod_client.get('/api/teams')
+        db.session.add(Team(team_id=3, name='Chelsea', short_name='CHE'))
+        db.session.commit()
+
+        assert len(prod_client.get('/api/teams').get_json()['data']) == 2
+
+        prod_client.post('/api/data/refresh')
+        assert len(prod_client.get('/api/teams').get_json()['data']) == 3
+
+
+class TestCorsPreflight:
+    """Test CORS preflight handling."""
+
+    def test_preflight_answered_before_dispatch(self, prod_app, prod_client, monkeypatch):
+        """Test that OPTIONS returns CORS headers without running the view."""
+        def fail(**kwargs):
+            raise AssertionError('optimizer should not run for preflight')
+
+        monkeypatch.setattr(prod_app.optimization_service, 'optimize_team', fail)
+
+        response = prod_client.options('/api/optimize')
+
+        assert response.status_code == 200
+        assert response.headers['Access-Control-Allow-Origin'] == '*'
+        assert response.headers['Access-Control-Max-Age'] == '600'
+        assert 'POST' in response.headers['Allow']
+
+    def test_cors_headers_set_once(self, prod_client):
+        """Test that every response carries exactly one copy of each CORS header."""
+        response = prod_client.get('/api/teams')
+
+        assert response.headers.getlist('Access-Control-Allow-Origin') == ['*']
+        assert response.headers['Access-Control-Allow-Methods'] == 'GET, POST, OPTIONS'
+
+    def test_preflight_unknown_url(self, prod_client):
+        """Test that preflight for an unknown URL is still a 404."""
+        assert prod_client.options('/api/missing').status_code == 404
+
+
+class TestConnectionPool:
+    """Test the production engine's connection pool."""
+
+    def test_queue_pool_sized_from_env(self, tmp_path, monkeypatch):
+        """Test that the pool is a QueuePool sized by POOL_SIZE."""
+        from sqlalchemy.pool import QueuePool
+
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / 'instance').mkdir()
+        monkeypatch.setenv('POOL_SIZE', '7')
+
+        app = create_production_app()
+        with app.app_context():
+            assert isinstance(db.engine.pool, QueuePool)
+            assert db.engine.pool.size() == 7
+
+
+class TestSchemaUpgrade:
+    """Test bringing an existing database up to the current models at startup."""
+
+    def test_startup_adds_expected_points_column(self, tmp_path, monkeypatch):
+        """Test that a database created before expected_points existed gets it, backfilled."""
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / 'instance').mkdir()
+
+        old_app = create_production_app()
+        with old_app.app_context():
+            db.session.add(Team(team_id=1, name='Liverpool', short_name='LIV'))
+            db.session.add(Player(player_id=1, web_name='Salah', team_id=1, position='MID',
+                                  now_cost=130, form=0.5))
+            db.session.commit()
+            with db.engine.begin() as conn:
+                conn.exec_driver_sql('DROP INDEX idx_player_status_expected_points')
+                conn.exec_driver_sql('ALTER TABLE players DROP COLUMN expected_points')
+            db.session.remove()
+            db.engine.dispose()
+
+        app = create_production_app()
+        with app.app_context():
+            assert Player.query.one().expected_points == 2.0
+            db.session.remove()
+            db.engine.dispose()
+
+    def test_stored_expected_points_used_everywhere(self, prod_app, prod_client, prod_players):
+        """Test that the dashboard and reasoning report the stored value, not a form estimate."""
+        prod_players[0].expected_points = 9.0
+        db.session.commit()
+
+        prod_client.get('/')
+        top_players = prod_app.cache.get('dashboard:v1')['top_players']
+        assert top_players[0]['web_name'] == 'Salah'
+        assert top_players[0]['expected_points'] == 9.0
+
+        reasoning_data = prod_app.reasoning_service._get_player_reasoning_data([1])
+        assert reasoning_data[1]['expected_points'] == 9.0